@@ -19,10 +19,7 @@ class ActionRegistry(PluginRegistry):
         self.register('notify', Notify)
 
     def parse(self, data, manager):
-        results = []
-        for d in data:
-            results.append(self.factory(d, manager))
-        return results
+        return [self.factory(d, manager) for d in data]
 
     def factory(self, data, manager):
         if isinstance(data, dict):
@@ -34,8 +31,9 @@ class ActionRegistry(PluginRegistry):
             action_type = data
             data = {}
 
-        action_class = self.get(action_type)
-        if action_class is None:
+        try:
+            action_class = self._factories[action_type]
+        except KeyError:
             raise PolicyValidationError(
                 "Invalid action type %s, valid actions %s" % (
                     action_type, list(self.keys())))
@@ -1,13 +1,65 @@
+import base64
+import functools
+import json
+import weakref
+import zlib
+
 try:
     from botocore.config import Config
 except ImportError:
     from c7n.config import Bag as Config  # pragma: no cover
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .core import EventAction
 from c7n import utils
 from c7n.manager import resources
 from c7n.version import version as VERSION
 
+# Payloads smaller than this gain nothing from compression, the gzip
+# header and base64 expansion would only enlarge them.
+COMPRESS_MIN_SIZE = 1024
+
+# Lambda caps async payloads at 256kb and sync payloads at 6mb, leave
+# some headroom for the request envelope.
+ASYNC_PAYLOAD_SIZE = 240 * 1024
+SYNC_PAYLOAD_SIZE = int(5.5 * 1024 * 1024)
+
+
+def dumps(data):
+    """Serialize data to utf-8 encoded json, using orjson when available.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(
+        data, cls=utils.DateTimeEncoder, separators=(',', ':')).encode('utf-8')
+
+
+def gzip_envelope(data):
+    """Wrap gzip data in a small json envelope.
+
+    The invoked lambda can detect the envelope by the `_c` key and
+    recover the original payload by base64 decoding and gunzipping `_d`.
+    """
+    return dumps({'_c': 'gz', '_d': base64.b64encode(data).decode('ascii')})
+
+
+def gzip_envelope_size(compressed_size):
+    """Upper bound on the envelope size for gzip data of the given size."""
+    return 4 * ((compressed_size + 2) // 3) + 32
+
+
+def deflate_bound(size):
+    """Upper bound on deflate output for input of the given size, including
+    a sync flush, for input that doesn't compress at all."""
+    return size + 5 * (size // 16383 + 1) + 6
+
 
 class LambdaInvoke(EventAction):
     """Invoke an arbitrary lambda
@@ -20,10 +72,22 @@ class LambdaInvoke(EventAction):
      - event / cloud trail event if any
      - version / version of custodian invoking the lambda
 
-    We automatically batch into sets of 250 for invocation,
-    We try to utilize async invocation by default, this imposes
-    some greater size limits of 128kb which means we batch
-    invoke.
+    We automatically batch resources into sets whose serialized
+    payload fits under `max_payload_size` bytes. We try to utilize
+    async invocation by default, which imposes a size limit of 256kb
+    (versus 6mb for sync), so the default target is 240kb for async
+    and 5.5mb for sync invokes. `batch_size` can additionally cap the
+    number of resources per invoke. Batches are invoked concurrently,
+    bounded by `concurrency` (default 8).
+
+    Note there is no default cap on resources per invoke, set
+    `batch_size: 250` to keep the batches of earlier releases.
+
+    Large payloads can be gzip compressed with `compress: gzip`, in
+    which case the lambda receives `{"_c": "gz", "_d": <base64 gzip>}`
+    and is responsible for decompressing it. Batches are then sized by
+    their compressed size against `max_payload_size`, so compressible
+    resources pack into fewer invokes.
 
     Example::
 
@@ -47,12 +111,18 @@ class LambdaInvoke(EventAction):
             'async': {'type': 'boolean'},
             'qualifier': {'type': 'string'},
             'batch_size': {'type': 'integer'},
+            'max_payload_size': {'type': 'integer'},
+            'concurrency': {'type': 'integer', 'minimum': 1},
             'timeout': {'type': 'integer'},
+            'compress': {'enum': ['none', 'gzip']},
         }
     }
 
     permissions = ('lambda:InvokeFunction',)
 
+    # session -> {timeout: client}, entries go away with their session
+    _client_cache = weakref.WeakKeyDictionary()
+
     def process(self, resources, event=None):
         params = dict(FunctionName=self.data['function'])
         if self.data.get('qualifier'):
@@ -61,26 +131,145 @@ class LambdaInvoke(EventAction):
         if self.data.get('async', True):
             params['InvocationType'] = 'Event'
 
-        config = Config(read_timeout=self.data.get('timeout', 90))
-        client = utils.local_session(
-            self.manager.session_factory).client('lambda', config=config)
+        client = self.get_client()
 
-        payload = {
+        # The envelope is constant across batches, serialize it once and
+        # splice each batch in as a trailing resources key. The head is
+        # built from the closing brace so it doesn't depend on the
+        # serializer's whitespace.
+        envelope = dumps({
             'version': VERSION,
             'event': event,
             'action': self.data,
-            'policy': self.manager.data}
-
-        results = []
-        for resource_set in utils.chunks(resources, self.data.get('batch_size', 250)):
-            payload['resources'] = resource_set
-            params['Payload'] = utils.dumps(payload)
-            result = client.invoke(**params)
-            result['Payload'] = result['Payload'].read()
-            if isinstance(result['Payload'], bytes):
-                result['Payload'] = result['Payload'].decode('utf-8')
-            results.append(result)
-        return results
+            'policy': self.manager.data}).rstrip()
+        head, tail = envelope[:-1] + b',"resources":[', b']}'
+
+        if self.data.get('compress', 'none') == 'gzip':
+            payloads = self.get_compressed_payloads(head, tail, resources)
+        else:
+            payloads = (
+                b''.join((head, b','.join(resource_set), tail))
+                for resource_set in self.get_batches(
+                    len(head) + len(tail), resources))
+        invokes = [dict(params, Payload=payload) for payload in payloads]
+
+        with self.executor_factory(
+                max_workers=self.data.get('concurrency', 8)) as w:
+            return list(w.map(functools.partial(self.invoke, client), invokes))
+
+    def get_client(self):
+        """Return a lambda client, reused across policy executions.
+
+        Clients are keyed on the session object, which local_session
+        rotates to refresh credentials, and on the read timeout. The cache
+        only holds sessions weakly, so a rotated session and its clients
+        are released once nothing else uses them.
+        """
+        timeout = self.data.get('timeout', 90)
+        session = utils.local_session(self.manager.session_factory)
+        clients = self._client_cache.get(session)
+        if clients is None:
+            clients = self._client_cache[session] = {}
+        if timeout not in clients:
+            clients[timeout] = session.client(
+                'lambda', config=Config(read_timeout=timeout))
+        return clients[timeout]
+
+    def invoke(self, client, params):
+        result = client.invoke(**params)
+        # always drain the body, async invokes return an empty one, so the
+        # connection goes back to the cached client's pool.
+        result['Payload'] = result['Payload'].read().decode('utf-8')
+        return result
+
+    def get_batch_limits(self):
+        max_size = self.data.get('max_payload_size')
+        if max_size is None:
+            max_size = (
+                self.data.get('async', True) and
+                ASYNC_PAYLOAD_SIZE or SYNC_PAYLOAD_SIZE)
+        return max_size, self.data.get('batch_size')
+
+    def get_batches(self, envelope_size, resources):
+        """Greedily pack resources into batches sized by serialized bytes.
+
+        Each resource is serialized once on its own, batches are yielded
+        as lists of serialized resources ready to be joined into a payload.
+        """
+        max_size, max_count = self.get_batch_limits()
+
+        batch, batch_size = [], envelope_size
+        for r in resources:
+            r = dumps(r)
+            # account for the list item separator
+            r_size = len(r) + 1
+            if batch and (batch_size + r_size > max_size or len(batch) == max_count):
+                yield batch
+                batch, batch_size = [], envelope_size
+            batch.append(r)
+            batch_size += r_size
+        if batch:
+            yield batch
+
+    def get_compressed_payloads(self, head, tail, resources):
+        """Greedily pack resources into gzip enveloped payloads.
+
+        Batches are sized by their compressed size, see GzipBatch.
+        """
+        max_size, max_count = self.get_batch_limits()
+        batch = GzipBatch(head, tail)
+        for r in resources:
+            r = dumps(r)
+            if batch.count and (
+                    batch.count == max_count or not batch.fits(r, max_size)):
+                yield batch.payload()
+                batch = GzipBatch(head, tail)
+            batch.add(r)
+        if batch.count:
+            yield batch.payload()
+
+
+class GzipBatch(object):
+    """A payload gzip compressed as resources are added to it.
+
+    The compressor is flushed after each resource, so the compressed size
+    so far is known exactly. A resource is only added while the batch
+    would stay under the size limit even if the resource didn't compress
+    at all, so batches never have to be compressed twice.
+    """
+
+    def __init__(self, head, tail):
+        self.compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        self.tail = tail
+        self.raw = [head]
+        self.out = [self.compressor.compress(head)]
+        self.size = len(self.out[0])
+        self.count = 0
+
+    def fits(self, resource, max_size):
+        return gzip_envelope_size(
+            self.size + deflate_bound(len(resource) + 1) +
+            deflate_bound(len(self.tail)) + 8) <= max_size
+
+    def add(self, resource):
+        if self.count:
+            resource = b',' + resource
+        chunk = self.compressor.compress(resource) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH)
+        self.raw.append(resource)
+        self.out.append(chunk)
+        self.size += len(chunk)
+        self.count += 1
+
+    def payload(self):
+        """The gzip envelope, or the raw payload if too small to benefit."""
+        self.raw.append(self.tail)
+        raw = b''.join(self.raw)
+        if len(raw) <= COMPRESS_MIN_SIZE:
+            return raw
+        self.out.append(self.compressor.compress(self.tail))
+        self.out.append(self.compressor.flush())
+        return gzip_envelope(b''.join(self.out))
 
 
 def register_action_invoke_lambda(registry, _):
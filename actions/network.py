@@ -1,8 +1,8 @@
 import itertools
-import jmespath
 import six
 
 from c7n.exceptions import PolicyExecutionError, PolicyValidationError
+from c7n.filters.related import compile_path
 from c7n import utils
 
 from .core import Action
@@ -71,9 +71,9 @@ class ModifyVpcSecurityGroupsAction(Action):
                 raise PolicyValidationError(self._format_error((
                     "policy:{policy} resource:{resource_type} does not support "
                     "security-group names only ids in action:{action_type}")))
-            self.vpc_expr = jmespath.compile(vpc_filter.RelatedIdsExpression)
+            self.vpc_expr = compile_path(vpc_filter.RelatedIdsExpression)
         if self.sg_expr is None:
-            self.sg_expr = jmespath.compile(
+            self.sg_expr = compile_path(
                 self.manager.filter_registry.get('security-group').RelatedIdsExpression)
         if 'all' in self._get_array('remove') and not self._get_array('isolation-group'):
             raise PolicyValidationError(self._format_error((
@@ -6,13 +6,31 @@ import logging
 
 log = logging.getLogger('custodian.config')
 
+_MISSING = object()
+
+# region is resolved from the environment per call, see Config.empty
+_DEFAULTS = {
+    'regions': (),
+    'cache': '',
+    'profile': None,
+    'account_id': None,
+    'assume_role': None,
+    'external_id': None,
+    'log_group': None,
+    'tracer': 'default',
+    'metrics_enabled': False,
+    'output_dir': '',
+    'cache_period': 0,
+    'dryrun': False,
+    'authorization_file': None}
+
 
 class Bag(dict):
     def __getattr__(self, k):
-        try:
-            return self[k]
-        except KeyError:
+        v = dict.get(self, k, _MISSING)
+        if v is _MISSING:
             raise AttributeError(k)
+        return v
 
 
 class Config(Bag):
@@ -25,21 +43,6 @@ class Config(Bag):
 
     @classmethod
     def empty(cls, **kw):
-        d = {}
-        d.update({
-            'region': os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
-            'regions': (),
-            'cache': '',
-            'profile': None,
-            'account_id': None,
-            'assume_role': None,
-            'external_id': None,
-            'log_group': None,
-            'tracer': 'default',
-            'metrics_enabled': False,
-            'output_dir': '',
-            'cache_period': 0,
-            'dryrun': False,
-            'authorization_file': None})
+        d = dict(_DEFAULTS, region=os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'))
         d.update(kw)
         return cls(d)
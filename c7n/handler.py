@@ -19,10 +19,12 @@ an event.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import errno
+import itertools
 import os
-import uuid
 import logging
 import json
+import time
 
 from c7n.policy import PolicyCollection
 from c7n.resources import load_resources
@@ -31,6 +33,11 @@ from c7n.config import Config
 
 import boto3
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 logging.root.setLevel(logging.DEBUG)
 logging.getLogger('botocore').setLevel(logging.WARNING)
 logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -40,26 +47,37 @@ log = logging.getLogger('custodian.lambda')
 # Env serverless specific configuration options, these are part of "public" interface
 #
 # We default to skipping events which denote they have errors
-C7N_SKIP_EVTERR = os.environ.get('C7N_SKIP_ERR_EVENT', 'yes') == 'yes' and True or False
+C7N_SKIP_EVTERR = os.environ.get('C7N_SKIP_ERR_EVENT', 'yes').strip().lower() == 'yes'
 
 # We default to logging the full event that triggered lambda execution
-C7N_DEBUG_EVENT = os.environ.get('C7N_DEBUG_EVENT', 'yes') == 'yes' and True or False
+C7N_DEBUG_EVENT = os.environ.get('C7N_DEBUG_EVENT', 'yes').strip().lower() == 'yes'
 
 # We default to not catching policy errors in lambda, which will lead to retry behavior
-C7N_CATCH_ERR = os.environ.get('C7N_CATCH_ERR', 'no').strip().lower() == 'yes' and True or False
+C7N_CATCH_ERR = os.environ.get('C7N_CATCH_ERR', 'no').strip().lower() == 'yes'
 
 #
 # Internal global variables
 #
+# Remove some configuration options that don't make sense to translate from
+# cli to lambda automatically.
+#  - assume role on cli doesn't translate, it is the default lambda role and
+#    used to provision the lambda.
+#  - profile doesnt translate to lambda its `home` dir setup dependent
+#  - dryrun doesn't translate (and shouldn't be present)
+#  - region doesn't translate from cli (the lambda is bound to a region), and
+#    on the cli represents the region the lambda is provisioned in.
+CLI_ONLY_OPTIONS = frozenset(('assume_role', 'profile', 'region', 'dryrun', 'cache'))
+
 # Default global cache of execution account id for initial configuration setup.
 account_id = None
 
 # config.json policy data dict
 policy_config = None
 
-# On cold start load all resources, requires a pythonpath directory scan
-if 'AWS_EXECUTION_ENV' in os.environ:
-    load_resources()
+# Unique per process and start time, with a counter for executions
+# within a warm container.
+_exec_prefix = '/tmp/ex-%d-%d' % (os.getpid(), int(time.time() * 1000))
+_exec_counter = itertools.count()
 
 
 def get_local_output_dir():
@@ -69,16 +87,18 @@ def get_local_output_dir():
     directory and changing unix execution users (2015-2018), so use a
     per execution temp space. With firecracker lambdas this may be outdated.
     """
-    output_dir = os.environ.get('C7N_OUTPUT_DIR', '/tmp/' + str(uuid.uuid4()))
-    if not os.path.exists(output_dir):
-        try:
-            os.mkdir(output_dir)
-        except OSError as error:
+    output_dir = os.environ.get('C7N_OUTPUT_DIR')
+    if output_dir is None:
+        output_dir = '%s-%d' % (_exec_prefix, next(_exec_counter))
+    try:
+        os.mkdir(output_dir)
+    except OSError as error:
+        if error.errno != errno.EEXIST:
             log.warning("Unable to make output directory: {}".format(error))
     return output_dir
 
 
-def init_config(policy_config):
+def init_config(policy_config, context=None):
     """Get policy lambda execution configuration.
 
     cli parameters are serialized into the policy lambda config,
@@ -87,23 +107,16 @@ def init_config(policy_config):
     --assume role and -s output directory get special handling, as
     to disambiguate any cli context.
 
-    account id is sourced from the config options or from api call
-    and cached as a global
+    account id is sourced from the config options, the lambda context's
+    function arn, or as a last resort from an api call, and cached as
+    a global
     """
     global account_id
 
-    exec_options = policy_config.get('execution-options', {})
-
-    # Remove some configuration options that don't make sense to translate from
-    # cli to lambda automatically.
-    #  - assume role on cli doesn't translate, it is the default lambda role and
-    #    used to provision the lambda.
-    #  - profile doesnt translate to lambda its `home` dir setup dependent
-    #  - dryrun doesn't translate (and shouldn't be present)
-    #  - region doesn't translate from cli (the lambda is bound to a region), and
-    #    on the cli represents the region the lambda is provisioned in.
-    for k in ('assume_role', 'profile', 'region', 'dryrun', 'cache'):
-        exec_options.pop(k, None)
+    # Copy rather than mutate, policy_config is cached across invocations.
+    exec_options = {
+        k: v for k, v in policy_config.get('execution-options', {}).items()
+        if k not in CLI_ONLY_OPTIONS}
 
     # a cli local directory doesn't translate to lambda
     if not exec_options.get('output_dir', '').startswith('s3'):
@@ -122,8 +135,12 @@ def init_config(policy_config):
     if 'assume_role' in exec_options:
         account_id = exec_options['assume_role'].split(':')[4]
     elif account_id is None:
-        session = boto3.Session()
-        account_id = get_account_id_from_sts(session)
+        function_arn = getattr(context, 'invoked_function_arn', None)
+        if function_arn:
+            account_id = function_arn.split(':')[4]
+        else:
+            session = boto3.Session()
+            account_id = get_account_id_from_sts(session)
     exec_options['account_id'] = account_id
 
     # Historical compatibility with manually set execution options
@@ -150,16 +167,26 @@ def dispatch_event(event, context):
     # Policies file should always be valid in lambda so do loading naively
     global policy_config
     if policy_config is None:
-        with open('config.json') as f:
-            policy_config = json.load(f)
+        with open('config.json', 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            policy_config = orjson.loads(data)
+        else:
+            policy_config = json.loads(data.decode('utf-8'))
 
     if not policy_config or not policy_config.get('policies'):
         return False
 
-    options = init_config(policy_config)
+    # Load resources on first use rather than at import, so cold starts
+    # on skipped events or empty configs don't pay for the imports.
+    load_resources()
+
+    options = init_config(policy_config, context)
 
     policies = PolicyCollection.from_data(policy_config, options)
     if policies:
+        # Policies run one at a time, their log outputs attach handlers
+        # to the shared custodian logger for the duration of a run.
         for p in policies:
             try:
                 # validation provides for an initialization point for
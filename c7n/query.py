@@ -60,9 +60,20 @@ class ResourceQuery(object):
             m = resource_type
         return m
 
-    def _invoke_client_enum(self, client, enum_op, params, path, retry=None):
-        if client.can_paginate(enum_op):
+    def _invoke_client_enum(self, client, enum_op, params, path, retry=None,
+                            pagination=None):
+        if pagination:
+            # for apis botocore ships no paginator definition for, the
+            # resource type can supply one instead of truncating at a page
+            p = Paginator(
+                getattr(client, enum_op), pagination,
+                client.meta.service_model.operation_model(
+                    client.meta.method_to_api_mapping[enum_op]))
+        elif client.can_paginate(enum_op):
             p = client.get_paginator(enum_op)
+        else:
+            p = None
+        if p is not None:
             if retry:
                 p.PAGE_ITERATOR_CLS = RetryPageIterator
             results = p.paginate(**params)
@@ -87,7 +98,8 @@ class ResourceQuery(object):
             params.update(extra_args)
         return self._invoke_client_enum(
             client, enum_op, params, path,
-            getattr(resource_manager, 'retry', None)) or []
+            getattr(resource_manager, 'retry', None),
+            getattr(m, 'enum_pagination', None)) or []
 
     def get(self, resource_manager, identities):
         """Get resources by identities
@@ -110,10 +122,12 @@ class ResourceQuery(object):
         if client_filter:
             # This logic was added to prevent the issue from:
             # https://github.com/cloud-custodian/cloud-custodian/issues/1398
+            id_set = set(identities)
             if all(map(lambda r: isinstance(r, six.string_types), resources)):
-                resources = [r for r in resources if r in identities]
+                resources = [r for r in resources if r in id_set]
             else:
-                resources = [r for r in resources if r[m.id] in identities]
+                id_key = m.id
+                resources = [r for r in resources if r[id_key] in id_set]
 
         return resources
 
@@ -480,9 +494,9 @@ class QueryResourceManager(ResourceManager):
             resources = self._cache.get(key)
             if resources is not None:
                 self.log.debug("Using cached results for get_resources")
-                m = self.get_model()
+                id_key = self.get_model().id
                 id_set = set(ids)
-                return [r for r in resources if r[m.id] in id_set]
+                return [r for r in resources if r[id_key] in id_set]
         return None
 
     def get_resources(self, ids, cache=True, augment=True):
@@ -532,6 +546,7 @@ class QueryResourceManager(ResourceManager):
             raise ValueError("%s do not have arns" % self.type)
 
         id_key = m.id
+        generate = None
 
         for r in resources:
             _id = r[id_key]
@@ -540,7 +555,9 @@ class QueryResourceManager(ResourceManager):
             elif 'arn' in _id[:3]:
                 arns.append(_id)
             else:
-                arns.append(self.generate_arn(_id))
+                if generate is None:
+                    generate = self.generate_arn
+                arns.append(generate(_id))
         return arns
 
     @property
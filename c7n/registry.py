@@ -49,6 +49,10 @@ class PluginRegistry(object):
     EVENT_FINAL = 1
     EVENTS = (EVENT_REGISTER, EVENT_FINAL)
 
+    # Bumped on any registration change across all registries, lets
+    # callers cheaply tell whether derived data (e.g. schema) is stale.
+    generation = 0
+
     def __init__(self, plugin_type):
         self.plugin_type = plugin_type
         self._factories = {}
@@ -67,6 +71,7 @@ class PluginRegistry(object):
         if klass:
             klass.type = name
             self._factories[name] = klass
+            PluginRegistry.generation += 1
             self.notify(self.EVENT_REGISTER, klass)
             return klass
 
@@ -76,6 +81,7 @@ class PluginRegistry(object):
                 return klass
             self._factories[name] = klass
             klass.type = name
+            PluginRegistry.generation += 1
             self.notify(self.EVENT_REGISTER, klass)
             return klass
         return _register_class
@@ -83,6 +89,7 @@ class PluginRegistry(object):
     def unregister(self, name):
         if name in self._factories:
             del self._factories[name]
+            PluginRegistry.generation += 1
 
     def notify(self, event, key=None):
         for subscriber in self._subscribers[event]:
@@ -27,26 +27,199 @@ the utils.type_schema function.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from collections import Counter
+from collections import Counter, OrderedDict
+import hashlib
 import json
 import logging
+import os
+import sys
 
-from jsonschema import Draft4Validator as Validator
+from jsonschema import Draft7Validator as Validator, RefResolver
 from jsonschema.exceptions import best_match
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from c7n.policy import execution
 from c7n.provider import clouds
+from c7n.registry import PluginRegistry
 from c7n.resources import load_resources
 from c7n.resolver import ValuesFrom
 from c7n.filters.core import ValueFilter, EventFilter, AgeFilter, OPERATORS, VALUE_TYPES
+from c7n.version import version
+
+log = logging.getLogger('custodian.schema')
+
+# Directory to persist checked schemas across processes in, the disk
+# cache is only used when set, see get_validator
+SCHEMA_CACHE_DIR = os.environ.get('C7N_SCHEMA_CACHE')
+
+# Number of schemas kept in the disk cache, older ones are removed on save
+SCHEMA_CACHE_SIZE = 4
+
+
+# Generated schema and its validators, keyed on a signature of the
+# registries so that any late registration (e.g. plugins) invalidates them.
+_SCHEMA_CACHE = {}
+
+# Registry signature and the registry generation it was computed at
+_SIGNATURE = [None, None]
+
+
+def _registry_signature():
+    """Signature of the registered resources, filters, actions and modes.
+
+    Walking the registries is only done again once something has been
+    registered or unregistered since the last call, typically just once
+    after load_resources.
+    """
+    if _SIGNATURE[0] == PluginRegistry.generation:
+        return _SIGNATURE[1]
+    generation = PluginRegistry.generation
+    # classes rather than counts, so replacing a registration is noticed
+    signature = [tuple(sorted(execution.items()))]
+    for cloud_name, cloud_type in sorted(clouds.items()):
+        for type_name, resource_type in sorted(cloud_type.resources.items()):
+            signature.append((
+                cloud_name, type_name, resource_type,
+                tuple(sorted(resource_type.filter_registry.items())),
+                tuple(sorted(resource_type.action_registry.items()))))
+    _SIGNATURE[:] = [generation, tuple(signature)]
+    return _SIGNATURE[1]
+
+
+def get_validator():
+    """Get the validator for the generated schema of all resources.
+
+    Generating and checking the schema is expensive, so both are cached
+    until the set of registered resources, filters, actions or modes
+    changes.
+    """
+    key = _registry_signature()
+    validator = _SCHEMA_CACHE.get(key)
+    if validator is None:
+        cache_path = schema = None
+        if SCHEMA_CACHE_DIR:
+            cache_path = _schema_cache_path(key)
+            schema = load_schema_cache(cache_path)
+        if schema is None:
+            schema = generate()
+            Validator.check_schema(schema)
+            if cache_path:
+                save_schema_cache(cache_path, schema)
+        _SCHEMA_CACHE.clear()
+        validator = _SCHEMA_CACHE[key] = get_schema_validator(schema)
+    return validator
+
+
+def _schema_cache_path(signature):
+    """Path of the on disk schema cache for the current code.
+
+    The name is keyed on the custodian version, the registry signature and
+    the path and mtime of every module defining a registered resource,
+    filter, action or mode, so that code changes invalidate it.
+    """
+    modules = set(e.__module__ for _, e in execution.items())
+    for _, cloud_type in clouds.items():
+        modules.add(cloud_type.__module__)
+        for _, resource_type in cloud_type.resources.items():
+            modules.add(resource_type.__module__)
+            modules.update(f.__module__ for _, f in resource_type.filter_registry.items())
+            modules.update(a.__module__ for _, a in resource_type.action_registry.items())
+
+    digest = hashlib.sha256(('%s %r' % (version, signature)).encode('utf8'))
+    for name in sorted(modules):
+        path = getattr(sys.modules.get(name), '__file__', None)
+        if path is None:
+            continue
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        digest.update(('%s %s' % (path, mtime)).encode('utf8'))
+    return os.path.join(SCHEMA_CACHE_DIR, 'schema-%s.json' % digest.hexdigest()[:16])
+
+
+def load_schema_cache(path):
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as fh:
+            return json.loads(fh.read().decode('utf8'))
+    except Exception as e:
+        log.warning("Could not load schema cache %s err: %s" % (path, e))
+
+
+def save_schema_cache(path, schema):
+    try:
+        if not os.path.exists(SCHEMA_CACHE_DIR):
+            os.makedirs(SCHEMA_CACHE_DIR)
+        # write then rename, so concurrent readers never see a partial file
+        tmp_path = '%s.%d' % (path, os.getpid())
+        with open(tmp_path, 'wb') as fh:
+            fh.write(json.dumps(schema).encode('utf8'))
+        os.rename(tmp_path, path)
+    except Exception as e:
+        log.debug("Could not save schema cache %s err: %s" % (path, e))
+        return
+    prune_schema_cache()
+
+
+def prune_schema_cache():
+    """Remove all but the most recently written schemas from the disk cache."""
+    try:
+        paths = [os.path.join(SCHEMA_CACHE_DIR, n) for n in os.listdir(SCHEMA_CACHE_DIR)
+                 if n.startswith('schema-') and n.endswith('.json')]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[SCHEMA_CACHE_SIZE:]:
+            os.remove(path)
+    except OSError as e:
+        log.debug("Could not prune schema cache %s err: %s" % (SCHEMA_CACHE_DIR, e))
+
+
+# Validators for schemas keyed by schema identity and registry generation
+_VALIDATOR_CACHE = OrderedDict()
+_VALIDATOR_CACHE_SIZE = 8
+
+
+def new_validator(schema):
+    """Create a jsonschema validator with the schema's own id pinned in
+    the resolver store, so refs never go out to fetch it.
+    """
+    store = {}
+    if schema.get('id'):
+        store[schema['id']] = schema
+    return Validator(
+        schema, resolver=RefResolver.from_schema(schema, store=store))
+
+
+def get_schema_validator(schema):
+    """Get the jsonschema validator for a schema.
+
+    Validators are keyed on the schema object and the registry generation,
+    a schema changed in place after its first use needs to be passed as a
+    new dict. The least recently used validators are evicted past a fixed
+    cache size.
+    """
+    key = (id(schema), PluginRegistry.generation)
+    entry = _VALIDATOR_CACHE.pop(key, None)
+    # the cached schema keeps its id from being reused while cached
+    if entry is None or entry[0] is not schema:
+        entry = (schema, new_validator(schema))
+    _VALIDATOR_CACHE[key] = entry
+    while len(_VALIDATOR_CACHE) > _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.popitem(last=False)
+    return entry[1]
 
 
 def validate(data, schema=None):
     if schema is None:
-        schema = generate()
-        Validator.check_schema(schema)
+        validator = get_validator()
+    else:
+        validator = get_schema_validator(schema)
 
-    validator = Validator(schema)
     errors = list(validator.iter_errors(data))
     if not errors:
         return check_unique(data) or []
@@ -69,11 +242,19 @@ def validate(data, schema=None):
 
 
 def check_unique(data):
-    counter = Counter([p['name'] for p in data.get('policies', [])])
-    for k, v in list(counter.items()):
-        if v == 1:
-            counter.pop(k)
-    if counter:
+    policies = data.get('policies', ())
+    if len(policies) < 2:
+        return None
+    counter = Counter()
+    dupes = False
+    for p in policies:
+        name = p['name']
+        counter[name] += 1
+        dupes = dupes or counter[name] > 1
+    if dupes:
+        # keep first-seen order so the reported name matches the old output
+        counter = Counter(OrderedDict(
+            (k, v) for k, v in counter.items() if v > 1))
         return [ValueError(
             "Only one policy with a given name allowed, duplicates: {}".format(counter)),
             list(counter.keys())[0]]
@@ -81,11 +262,11 @@ def check_unique(data):
 
 def policy_error_scope(error, data):
     """Scope a schema error to its policy name and resource."""
-    err_path = list(error.absolute_path)
-    if err_path[0] != 'policies':
+    # only the first two path elements are needed
+    err_path = iter(error.absolute_path)
+    if next(err_path, None) != 'policies':
         return error
-    pdata = data['policies'][err_path[1]]
-    pdata.get('name', 'unknown')
+    pdata = data['policies'][next(err_path)]
     error.message = "Error on policy:{} resource:{}\n".format(
         pdata.get('name', 'unknown'), pdata.get('resource', 'unknown')) + error.message
     return error
@@ -112,7 +293,10 @@ def specific_error(error):
     if r is not None:
         found = None
         for idx, v in enumerate(error.validator_value):
-            if v['$ref'].rsplit('/', 2)[1].endswith(r):
+            # refs are of the form #/definitions/resources/<type>/policy
+            ref = v['$ref']
+            end = ref.rfind('/')
+            if ref[ref.rfind('/', 0, end) + 1:end].endswith(r):
                 found = idx
                 break
         if found is not None:
@@ -120,16 +304,18 @@ def specific_error(error):
             # failures, we have to index back to the policy
             # of interest.
             for e in error.context:
-                # resource policies have a fixed path from
-                # the top of the schema
-                if e.absolute_schema_path[4] == found:
+                # resource policies have a fixed path from the top of
+                # the schema, with context errors the relative path
+                # starts at the anyOf index, which avoids rebuilding
+                # the absolute path through every parent.
+                if e.relative_schema_path[0] == found:
                     return specific_error(e)
             return specific_error(error.context[idx])
 
     if t is not None:
         found = None
         for idx, v in enumerate(error.validator_value):
-            if '$ref' in v and v['$ref'].rsplit('/', 2)[-1] == t:
+            if '$ref' in v and v['$ref'][v['$ref'].rfind('/') + 1:] == t:
                 found = idx
                 break
             elif 'type' in v and t in v['properties']['type']['enum']:
@@ -138,7 +324,9 @@ def specific_error(error):
 
         if found is not None:
             for e in error.context:
-                for el in reversed(e.absolute_schema_path):
+                # the relative path always holds the anyOf/oneOf index, so
+                # its last int is also the absolute path's last int.
+                for el in reversed(e.relative_schema_path):
                     if isinstance(el, int):
                         if el == found:
                             return e
@@ -323,19 +511,6 @@ def process_resource(type_name, resource_type, resource_defs, alias_name=None, d
     action_refs.append(
         {'enum': list(resource_type.action_registry.keys())})
 
-    nested_filter_refs = []
-    filters_seen = set()
-    for k, v in sorted(resource_type.filter_registry.items()):
-        if v in filters_seen:
-            continue
-        else:
-            filters_seen.add(v)
-        nested_filter_refs.append(
-            {'$ref': '#/definitions/resources/%s/filters/%s' % (
-                type_name, k)})
-    nested_filter_refs.append(
-        {'$ref': '#/definitions/filters/valuekv'})
-
     filter_refs = []
     filters_seen = set()  # for aliases
     for filter_name, f in sorted(resource_type.filter_registry.items()):
@@ -353,14 +528,16 @@ def process_resource(type_name, resource_type, resource_defs, alias_name=None, d
             filter_refs.append({
                 '$ref': '#/definitions/filters/%s' % filter_name})
             continue
-        elif filter_name == 'value':
-            r['filters'][filter_name] = {
-                '$ref': '#/definitions/filters/value'}
-            r['filters']['valuekv'] = {
-                '$ref': '#/definitions/filters/valuekv'}
-        elif filter_name == 'event':
+        elif filter_name in ('value', 'event'):
+            # reference the shared definition directly, rather than via
+            # a resource definition that is itself only a reference.
             r['filters'][filter_name] = {
-                '$ref': '#/definitions/filters/event'}
+                '$ref': '#/definitions/filters/%s' % filter_name}
+            if filter_name == 'value':
+                r['filters']['valuekv'] = {
+                    '$ref': '#/definitions/filters/valuekv'}
+            filter_refs.append(r['filters'][filter_name])
+            continue
         else:
             r['filters'][filter_name] = f.schema
         filter_refs.append(
@@ -412,26 +589,17 @@ def resource_vocabulary(cloud_name=None, qualify_name=True):
                 resources[rname] = rtype
 
     for type_name, resource_type in resources.items():
-        classes = {'actions': {}, 'filters': {}, 'resource': resource_type}
-        actions = []
-        for action_name, cls in resource_type.action_registry.items():
-            actions.append(action_name)
-            classes['actions'][action_name] = cls
-
-        filters = []
-        for filter_name, cls in resource_type.filter_registry.items():
-            filters.append(filter_name)
-            classes['filters'][filter_name] = cls
-
+        classes = {
+            'actions': dict(resource_type.action_registry.items()),
+            'filters': dict(resource_type.filter_registry.items()),
+            'resource': resource_type}
         vocabulary[type_name] = {
-            'filters': sorted(filters),
-            'actions': sorted(actions),
+            'filters': sorted(classes['filters']),
+            'actions': sorted(classes['actions']),
             'classes': classes,
         }
 
-    vocabulary["mode"] = {}
-    for mode_name, cls in execution.items():
-        vocabulary["mode"][mode_name] = cls
+    vocabulary["mode"] = dict(execution.items())
 
     return vocabulary
 
@@ -448,10 +616,8 @@ def summary(vocabulary):
             stats = providers.setdefault(provider, {
                 'resources': 0, 'actions': Counter(), 'filters': Counter()})
             stats['resources'] += 1
-            for a in rv.get('actions'):
-                stats['actions'][a] += 1
-            for f in rv.get('filters'):
-                stats['filters'][f] += 1
+            stats['actions'].update(rv.get('actions'))
+            stats['filters'].update(rv.get('filters'))
 
     for provider, stats in providers.items():
         print("%s:" % provider)
@@ -466,7 +632,11 @@ def summary(vocabulary):
 
 def json_dump(resource=None):
     load_resources()
-    print(json.dumps(generate(resource), indent=2))
+    schema = generate(resource)
+    if orjson is not None:
+        print(orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode('utf8'))
+    else:
+        print(json.dumps(schema, indent=2))
 
 
 if __name__ == '__main__':
@@ -199,6 +199,40 @@ def group_by(resources, key):
     return resource_map
 
 
+# Client configs by connection pool size, see client_config
+_CLIENT_CONFIGS = {}
+
+
+def client_config(pool=None):
+    """Botocore client config for clients shared by concurrent workers.
+
+    Uses the adaptive retry mode, which rate limits on the client side so
+    that workers back off together when throttled rather than each
+    retrying on its own. Pass the number of workers sharing the client as
+    pool, so each has a kept alive connection (botocore defaults to 10).
+    """
+    config = _CLIENT_CONFIGS.get(pool)
+    if config is None:
+        from botocore.config import Config
+        kw = {'retries': {'mode': 'adaptive', 'max_attempts': 10}}
+        if pool:
+            kw['max_pool_connections'] = pool
+        config = _CLIENT_CONFIGS[pool] = Config(**kw)
+    return config
+
+
+def unique_by(resources, key):
+    """Return resources with duplicates on the given key removed, keeping order.
+    """
+    seen = set()
+    results = []
+    for r in resources:
+        if r[key] not in seen:
+            seen.add(r[key])
+            results.append(r)
+    return results
+
+
 def chunks(iterable, size=50):
     """Break an iterable into lists of size"""
     batch = []
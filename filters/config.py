@@ -52,6 +52,16 @@ class ConfigCompliance(Filter):
     schema_alias = True
     annotation_key = 'c7n:config-compliance'
 
+    def __init__(self, data, manager=None):
+        super(ConfigCompliance, self).__init__(data, manager)
+        # filter data is fixed for the life of the filter, so compile
+        # the evaluation filters once rather than per process call.
+        self.eval_filters = []
+        for f in self.data.get('eval_filters', ()):
+            vf = ValueFilter(f)
+            vf.annotate = False
+            self.eval_filters.append(vf)
+
     def get_resource_map(self, filters, resource_model, resources):
         rule_ids = self.data.get('rules')
         states = self.data.get('states', ['NON_COMPLIANT'])
@@ -59,6 +69,8 @@ class ConfigCompliance(Filter):
 
         client = local_session(self.manager.session_factory).client('config')
         resource_map = {}
+        # only keep evaluations for resources in the current set
+        wanted = frozenset(r[resource_model.id] for r in resources)
 
         for rid in rule_ids:
             pager = client.get_paginator('get_compliance_details_by_config_rule')
@@ -74,27 +86,19 @@ class ConfigCompliance(Filter):
                     # processed.
                     if rident['ResourceType'] != resource_model.config_type:
                         continue
-
-                    if not filters:
-                        resource_map.setdefault(
-                            rident['ResourceId'], []).append(e)
+                    if rident['ResourceId'] not in wanted:
                         continue
 
-                    if op([f.match(e) for f in filters]):
+                    if not filters or op(f.match(e) for f in filters):
                         resource_map.setdefault(
                             rident['ResourceId'], []).append(e)
 
         return resource_map
 
     def process(self, resources, event=None):
-        filters = []
-        for f in self.data.get('eval_filters', ()):
-            vf = ValueFilter(f)
-            vf.annotate = False
-            filters.append(vf)
-
         resource_model = self.manager.get_model()
-        resource_map = self.get_resource_map(filters, resource_model, resources)
+        resource_map = self.get_resource_map(
+            self.eval_filters, resource_model, resources)
 
         results = []
         for r in resources:
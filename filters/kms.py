@@ -32,14 +32,25 @@ class KmsRelatedFilter(RelatedResourceFilter):
     RelatedResource = "c7n.resources.kms.Key"
     AnnotationKey = "matched-kms-key"
 
-    def process(self, resources, event=None):
+    def get_alias_map(self):
+        """Map key ids to their first alias name, with one account wide listing."""
         client = local_session(self.manager.session_factory).client('kms')
+        alias_map = {}
+        try:
+            for page in client.get_paginator('list_aliases').paginate():
+                for a in page.get('Aliases', ()):
+                    if a.get('TargetKeyId'):
+                        alias_map.setdefault(a['TargetKeyId'], a.get('AliasName', ''))
+        except ClientError as e:
+            self.log.warning(e)
+            return None
+        return alias_map
+
+    def process(self, resources, event=None):
         related = self.get_related(resources)
-        for r in related.values():
-            try:
-                alias_info = self.manager.retry(client.list_aliases, KeyId=r.get('KeyId'))
-            except ClientError as e:
-                self.log.warning(e)
-                continue
-            r['c7n:AliasName'] = alias_info.get('Aliases')[0].get('AliasName', '')
+        if related:
+            alias_map = self.get_alias_map()
+            if alias_map is not None:
+                for r in related.values():
+                    r['c7n:AliasName'] = alias_map.get(r.get('KeyId'), '')
         return [r for r in resources if self.process_resource(r, related)]
@@ -6,9 +6,9 @@ from six.moves.urllib_parse import urlparse
 
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
-from botocore.vendored import requests
-
 from dateutil.tz import tzutc
+import requests
+from requests.adapters import HTTPAdapter
 
 from c7n.credentials import assumed_session
 from c7n.filters import Filter
@@ -27,18 +27,30 @@ class Locked(Filter):
         region={'type': 'string'},
         required=('endpoint',))
 
+    max_workers = 16
+
     def process(self, resources, event=None):
         self._model = self.manager.get_model()
         self._auth = self.get_api_credentials()
+        # share keep-alive connections across the concurrent lookups
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
         results = []
-        for r in resources:
-            data = self.get_lock_status(r)
-            if 'Message' in data:
-                raise RuntimeError(data['Message'])
-            if data['LockStatus'] == 'locked':
-                r['c7n:locked_date'] = datetime.utcfromtimestamp(
-                    data['RevisionDate']).replace(tzinfo=tzutc())
-                results.append(r)
+        try:
+            with self.executor_factory(max_workers=self.max_workers) as w:
+                for r, data in zip(resources, w.map(self.get_lock_status, resources)):
+                    if 'Message' in data:
+                        raise RuntimeError(data['Message'])
+                    if data['LockStatus'] == 'locked':
+                        r['c7n:locked_date'] = datetime.utcfromtimestamp(
+                            data['RevisionDate']).replace(tzinfo=tzutc())
+                        results.append(r)
+        finally:
+            self._session.close()
         return results
 
     def get_api_credentials(self):
@@ -57,7 +69,7 @@ class Locked(Filter):
         endpoint = self.data['endpoint'].rstrip('/')
         account_id = self.manager.config.account_id
         params = {'parent_id': self.get_parent_id(resource, account_id)}
-        result = requests.get("%s/%s/locks/%s" % (
+        result = self._session.get("%s/%s/locks/%s" % (
             endpoint,
             account_id,
             resource[self._model.id]), params=params, auth=self._auth)
@@ -75,15 +87,17 @@ class SignatureAuth(requests.auth.AuthBase):
         self.credentials = credentials
         self.region = region
         self.service = service
+        # the signer only holds the credentials, service and region, and
+        # reads credentials on each signing, so it can be reused.
+        self.signer = SigV4Auth(credentials, service, region)
 
     def __call__(self, r):
         url = urlparse(r.url)
-        path = url.path or '/'
-        qs = url.query and '?%s' % url.query or ''
-        safe_url = url.scheme + '://' + url.netloc.split(':')[0] + path + qs
+        safe_url = '%s://%s%s%s' % (
+            url.scheme, url.netloc.split(':')[0], url.path or '/',
+            url.query and '?%s' % url.query or '')
         request = AWSRequest(
             method=r.method.upper(), url=safe_url, data=r.body)
-        SigV4Auth(
-            self.credentials, self.service, self.region).add_auth(request)
-        r.headers.update(dict(request.headers.items()))
+        self.signer.add_auth(request)
+        r.headers.update(request.headers.items())
         return r
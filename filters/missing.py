@@ -1,4 +1,5 @@
 
+from concurrent.futures import as_completed
 
 from .core import Filter
 
@@ -56,13 +57,22 @@ class Missing(Filter):
 
         # For regional resources and multi-region execution, the policy matches if
         # the resource is missing in any region.
-        found = {}
-        for p in provider.initialize_policies(
-                PolicyCollection([self.embedded_policy], self.manager.config),
-                self.manager.config):
+        policies = list(provider.initialize_policies(
+            PolicyCollection([self.embedded_policy], self.manager.config),
+            self.manager.config))
+        if not policies:
+            return []
+        for p in policies:
             p.expand_variables(p.get_variables())
             p.validate()
-            found[p.options.region] = p.poll()
-        if not all(found.values()):
-            return resources
+
+        # regions are polled concurrently, stopping at the first region
+        # where the resource is missing.
+        with self.executor_factory(max_workers=min(16, len(policies))) as w:
+            futures = [w.submit(p.poll) for p in policies]
+            for f in as_completed(futures):
+                if not f.result():
+                    for pending in futures:
+                        pending.cancel()
+                    return resources
         return []
@@ -2,11 +2,61 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import importlib
+import re
+from itertools import chain
 
 import jmespath
 
 from .core import ValueFilter, OPERATORS
 
+# plain dotted field paths, optionally flattened, e.g. "VpcConfig.SubnetIds[]"
+SIMPLE_PATH = re.compile(r'^(\w+(?:\.\w+)*)(\[\])?$')
+
+
+# compiled jmespath expressions shared across filter instances
+_EXPRESSIONS = {}
+
+
+def compile_path(expression):
+    """Compile a jmespath expression once per process."""
+    compiled = _EXPRESSIONS.get(expression)
+    if compiled is None:
+        compiled = _EXPRESSIONS.setdefault(
+            expression, jmespath.compile(expression))
+    return compiled
+
+
+def compile_ids_expression(expression):
+    """Compile a related ids expression into a function over resources.
+
+    Simple field paths are evaluated with dict lookups, anything else
+    falls back to a jmespath projection over the resource list.
+    """
+    match = SIMPLE_PATH.match(expression)
+    if match is None:
+        return compile_path("[].%s" % expression).search
+
+    parts = match.group(1).split('.')
+    flatten = bool(match.group(2))
+
+    def search(resources):
+        found = []
+        for r in resources:
+            v = r
+            for p in parts:
+                if not isinstance(v, dict):
+                    v = None
+                    break
+                v = v.get(p)
+            if v is None:
+                continue
+            if flatten and isinstance(v, list):
+                found.extend(i for i in v if i is not None)
+            else:
+                found.append(v)
+        return found
+    return search
+
 
 class RelatedResourceFilter(ValueFilter):
 
@@ -15,6 +65,19 @@ class RelatedResourceFilter(ValueFilter):
     AnnotationKey = None
     FetchThreshold = 10
 
+    # compiled id expressions, keyed by RelatedIdsExpression
+    _COMPILED = {}
+    # related resource manager classes, keyed by RelatedResource
+    _MANAGER_CLASSES = {}
+
+    _related_manager = None
+    # per resource related ids for the resource set being processed
+    _resource_ids = None
+
+    def __init__(self, data, manager=None):
+        super(RelatedResourceFilter, self).__init__(data, manager)
+        self.op_and = self.data.get('operator', 'or') == 'and'
+
     def get_permissions(self):
         return self.get_resource_manager().get_permissions()
 
@@ -33,30 +96,46 @@ class RelatedResourceFilter(ValueFilter):
         return super(RelatedResourceFilter, self).validate()
 
     def get_related_ids(self, resources):
-        return set(jmespath.search(
-            "[].%s" % self.RelatedIdsExpression, resources))
+        search = self._COMPILED.get(self.RelatedIdsExpression)
+        if search is None:
+            search = self._COMPILED.setdefault(
+                self.RelatedIdsExpression,
+                compile_ids_expression(self.RelatedIdsExpression))
+        return set(search(resources) or ())
 
     def get_related(self, resources):
         resource_manager = self.get_resource_manager()
-        related_ids = self.get_related_ids(resources)
-        model = resource_manager.get_model()
+        if self._resource_ids is not None:
+            related_ids = set().union(*self._resource_ids.values())
+        else:
+            related_ids = self.get_related_ids(resources)
+        model_id = resource_manager.get_model().id
         if len(related_ids) < self.FetchThreshold:
             related = resource_manager.get_resources(list(related_ids))
         else:
             related = resource_manager.resources()
-        return {r[model.id]: r for r in related
-                if r[model.id] in related_ids}
+        return {r[model_id]: r for r in related
+                if r[model_id] in related_ids}
 
     def get_resource_manager(self):
-        mod_path, class_name = self.RelatedResource.rsplit('.', 1)
-        module = importlib.import_module(mod_path)
-        manager_class = getattr(module, class_name)
-        return manager_class(self.manager.ctx, {})
-
-    def process_resource(self, resource, related):
-        related_ids = self.get_related_ids([resource])
-        model = self.manager.get_model()
-        op = self.data.get('operator', 'or')
+        manager = self._related_manager
+        if manager is None or manager.ctx is not self.manager.ctx:
+            manager_class = self._MANAGER_CLASSES.get(self.RelatedResource)
+            if manager_class is None:
+                mod_path, class_name = self.RelatedResource.rsplit('.', 1)
+                module = importlib.import_module(mod_path)
+                manager_class = self._MANAGER_CLASSES.setdefault(
+                    self.RelatedResource, getattr(module, class_name))
+            manager = self._related_manager = manager_class(self.manager.ctx, {})
+        return manager
+
+    def process_resource(self, resource, related, model=None):
+        if self._resource_ids is not None and id(resource) in self._resource_ids:
+            related_ids = self._resource_ids[id(resource)]
+        else:
+            related_ids = self.get_related_ids([resource])
+        if model is None:
+            model = self.manager.get_model()
         found = []
 
         if self.data.get('match-resource') is True:
@@ -76,7 +155,7 @@ class RelatedResourceFilter(ValueFilter):
                     "Resource %s:%s references non existant %s: %s",
                     model.type,
                     resource[model.id],
-                    self.RelatedResource.rsplit('.', 1)[-1],
+                    self.RelatedResource.rpartition('.')[2],
                     rid)
                 continue
             if self.match(robj):
@@ -85,17 +164,28 @@ class RelatedResourceFilter(ValueFilter):
         if found:
             self._add_annotations(found, resource)
 
-        if op == 'or' and found:
-            return True
-        elif op == 'and' and len(found) == len(related_ids):
-            return True
-        return False
+        if self.op_and:
+            return len(found) == len(related_ids)
+        return bool(found)
 
     def _add_annotations(self, related_ids, resource):
         if self.AnnotationKey is not None:
             akey = 'c7n:%s' % self.AnnotationKey
-            resource[akey] = list(set(related_ids).union(resource.get(akey, [])))
+            resource[akey] = list(dict.fromkeys(
+                chain(resource.get(akey, ()), related_ids)))
 
     def process(self, resources, event=None):
-        related = self.get_related(resources)
-        return [r for r in resources if self.process_resource(r, related)]
+        self._resource_ids = {
+            id(r): self.get_related_ids([r]) for r in resources}
+        try:
+            related = self.get_related(resources)
+            # with nothing to match against, an 'or' filter can't match
+            # (resource counts don't depend on the related resources)
+            if (not related and not self.op_and and
+                    self.data.get('value_type') != 'resource_count'):
+                return []
+            model = self.manager.get_model()
+            return [r for r in resources
+                    if self.process_resource(r, related, model)]
+        finally:
+            self._resource_ids = None
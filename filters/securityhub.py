@@ -1,6 +1,8 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from c7n.utils import local_session, type_schema
+import functools
+
+from c7n.utils import chunks, get_retry, local_session, type_schema
 from .core import Filter
 from c7n.manager import resources
 
@@ -25,20 +27,59 @@ class SecurityHubFindingFilter(Filter):
             from c7n.resources import aws
             aws.shape_validate(query, self.query_shape, 'securityhub')
 
+    # GetFindings accepts at most 20 values per filter field.
+    batch_size = 20
+    page_size = 100
+    max_workers = 8
+    retry = staticmethod(get_retry(('TooManyRequestsException', 'ThrottlingException')))
+
     def process(self, resources, event=None):
         client = local_session(
             self.manager.session_factory).client(
                 'securityhub', region_name=self.data.get('region'))
-        found = []
+        arn_resources = list(zip(self.manager.get_arns(resources), resources))
+        findings = {}
+
+        with self.executor_factory(max_workers=self.max_workers) as w:
+            for results in w.map(
+                    functools.partial(self.get_findings, client),
+                    chunks([arn for arn, _ in arn_resources], self.batch_size)):
+                for arn, arn_findings in results.items():
+                    findings.setdefault(arn, []).extend(arn_findings)
+
+        return list(self.annotate_found(arn_resources, findings))
+
+    def annotate_found(self, arn_resources, findings):
+        for r_arn, resource in arn_resources:
+            arn_findings = findings.get(r_arn)
+            if arn_findings:
+                resource[self.annotation_key] = arn_findings
+                yield resource
+
+    def get_findings(self, client, arns):
+        """Fetch findings for a batch of arns, keyed by resource arn."""
         params = dict(self.data.get('query', {}))
+        params['ResourceId'] = [
+            {"Value": arn, "Comparison": "EQUALS"} for arn in arns]
+        wanted = set(arns)
+        results = {}
+
+        for finding in self.iter_findings(client, params):
+            for arn in {r['Id'] for r in finding.get('Resources', ())
+                        if r.get('Id') in wanted}:
+                results.setdefault(arn, []).append(finding)
+        return results
 
-        for r_arn, resource in zip(self.manager.get_arns(resources), resources):
-            params['ResourceId'] = [{"Value": r_arn, "Comparison": "EQUALS"}]
-            findings = client.get_findings(Filters=params).get("Findings")
-            if len(findings) > 0:
-                resource[self.annotation_key] = findings
-                found.append(resource)
-        return found
+    def iter_findings(self, client, params):
+        """Yield findings matching the filters, following all pages."""
+        kw = {'MaxResults': self.page_size}
+        while True:
+            response = self.retry(client.get_findings, Filters=params, **kw)
+            for finding in response.get('Findings', ()):
+                yield finding
+            if not response.get('NextToken'):
+                break
+            kw['NextToken'] = response['NextToken']
 
     @classmethod
     def register_resources(klass, registry, resource_class):
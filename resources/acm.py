@@ -1,6 +1,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+
 from c7n.actions import BaseAction
 from c7n.manager import resources
 from c7n.query import QueryResourceManager, DescribeSource, ConfigSource
@@ -72,8 +74,8 @@ class CertificateDeleteAction(BaseAction):
 
     def process(self, certificates):
         client = local_session(self.manager.session_factory).client('acm')
-        for cert in certificates:
-            self.process_cert(client, cert)
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(functools.partial(self.process_cert, client), certificates))
 
     def process_cert(self, client, cert):
         try:
@@ -1,14 +1,18 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
-from c7n.utils import local_session
+from c7n.utils import get_retry, local_session
 
 
 @resources.register('backup-plan')
 class BackupPlan(QueryResourceManager):
 
+    retry = staticmethod(get_retry(('ThrottlingException',)))
+
     class resource_type(object):
         service = 'backup'
         enum_spec = ('list_backup_plans', 'BackupPlansList', None)
@@ -23,25 +27,27 @@ class BackupPlan(QueryResourceManager):
     def augment(self, resources):
         super(BackupPlan, self).augment(resources)
         client = local_session(self.session_factory).client('backup')
-        results = []
-        for r in resources:
-            try:
-                tags = client.list_tags(ResourceArn=r['BackupPlanArn']).get('Tags', {})
-            except client.exceptions.ResourceNotFoundException:
-                continue
-            r['Tags'] = [{'Name': k, 'Value': v} for k, v in tags.items()]
-            results.append(r)
-
-        return results
+        with self.executor_factory(max_workers=3) as w:
+            return list(filter(None, w.map(
+                functools.partial(self._augment_plan, client), resources)))
+
+    def _augment_plan(self, client, r):
+        try:
+            tags = client.list_tags(ResourceArn=r['BackupPlanArn']).get('Tags', {})
+        except client.exceptions.ResourceNotFoundException:
+            return None
+        r['Tags'] = [{'Name': k, 'Value': v} for k, v in tags.items()]
+        return r
 
     def get_resources(self, resource_ids, cache=True):
         client = local_session(self.session_factory).client('backup')
-        resources = []
-
-        for rid in resource_ids:
-            try:
-                resources.append(
-                    client.get_backup_plan(BackupPlanId=rid)['BackupPlan'])
-            except client.exceptions.ResourceNotFoundException:
-                continue
-        return resources
+        with self.executor_factory(max_workers=3) as w:
+            return list(filter(None, w.map(
+                functools.partial(self._get_plan, client), resource_ids)))
+
+    def _get_plan(self, client, rid):
+        try:
+            return self.retry(
+                client.get_backup_plan, BackupPlanId=rid)['BackupPlan']
+        except client.exceptions.ResourceNotFoundException:
+            return None
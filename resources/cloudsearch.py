@@ -4,7 +4,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from c7n.actions import Action
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
-from c7n.utils import local_session, type_schema
+from c7n.utils import get_retry, local_session, type_schema
 
 
 @resources.register('cloudsearch')
@@ -25,11 +25,14 @@ class Delete(Action):
 
     schema = type_schema('delete')
     permissions = ('cloudsearch:DeleteDomain',)
+    retry = staticmethod(get_retry(('Throttling',)))
 
     def process(self, resources):
         client = local_session(
             self.manager.session_factory).client('cloudsearch')
-        for r in resources:
-            if r['Created'] is not True or r['Deleted'] is True:
-                continue
-            client.delete_domain(DomainName=r['DomainName'])
+        domains = [r['DomainName'] for r in resources
+                   if r['Created'] is True and r['Deleted'] is not True]
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(
+                lambda d: self.retry(client.delete_domain, DomainName=d),
+                domains))
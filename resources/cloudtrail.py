@@ -42,11 +42,13 @@ class IsShadow(Filter):
     permissions = ('cloudtrail:DescribeTrails',)
     embedded = False
 
+    def __init__(self, data, manager=None):
+        super(IsShadow, self).__init__(data, manager)
+        self.predicate = bool if self.data.get('state', True) else operator.not_
+
     def process(self, resources, event=None):
-        anded = lambda x: True # NOQA
-        op = self.data.get('state', True) and anded or operator.__not__
         rcount = len(resources)
-        trails = [t for t in resources if op(self.is_shadow(t))]
+        trails = [t for t in resources if self.predicate(self.is_shadow(t))]
         if len(trails) != rcount and self.embedded:
             self.log.info("implicitly filtering shadow trails %d -> %d",
                      rcount, len(trails))
@@ -55,8 +57,10 @@ class IsShadow(Filter):
     def is_shadow(self, t):
         if t.get('IsOrganizationTrail') and self.manager.config.account_id not in t['TrailARN']:
             return True
-        if t.get('IsMultiRegionTrail') and t['HomeRegion'] not in t['TrailARN']:
+        # a multi-region trail's copies outside its home region are shadows
+        if t.get('IsMultiRegionTrail') and t['HomeRegion'] != self.manager.config.region:
             return True
+        return False
 
 
 @CloudTrail.filter_registry.register('status')
@@ -81,25 +85,40 @@ class Status(ValueFilter):
     annotation_key = 'c7n:TrailStatus'
 
     def process(self, resources, event=None):
-        for r in resources:
-            region = self.manager.config.region
-            trail_arn = Arn.parse(r['TrailARN'])
+        current_region = self.manager.config.region
+        account_id = self.manager.config.account_id
+        session = local_session(self.manager.session_factory)
+        clients = {}
+        pending = []
 
-            if (r.get('IsOrganizationTrail') and
-                    self.manager.config.account_id != trail_arn.account_id):
-                continue
-            if r.get('HomeRegion') and r['HomeRegion'] != region:
-                region = trail_arn.region
+        for r in resources:
             if self.annotation_key in r:
                 continue
-            client = local_session(self.manager.session_factory).client(
-                'cloudtrail', region_name=region)
-            status = client.get_trail_status(Name=r['Name'])
-            status.pop('ResponseMetadata')
-            r[self.annotation_key] = status
+            region = current_region
+            home_region = r.get('HomeRegion')
+            if r.get('IsOrganizationTrail') or (
+                    home_region and home_region != current_region):
+                trail_arn = Arn.parse(r['TrailARN'])
+                if (r.get('IsOrganizationTrail') and
+                        account_id != trail_arn.account_id):
+                    continue
+                if home_region and home_region != current_region:
+                    region = trail_arn.region
+            if region not in clients:
+                clients[region] = session.client('cloudtrail', region_name=region)
+            pending.append((clients[region], r))
+
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(self.annotate_status, pending))
 
         return super(Status, self).process(resources)
 
+    def annotate_status(self, client_resource):
+        client, r = client_resource
+        status = client.get_trail_status(Name=r['Name'])
+        status.pop('ResponseMetadata')
+        r[self.annotation_key] = status
+
     def __call__(self, r):
         return self.match(r['c7n:TrailStatus'])
 
@@ -189,10 +208,10 @@ class SetLogging(Action):
         shadow_check = IsShadow({'state': False}, self.manager)
         shadow_check.embedded = True
         resources = shadow_check.process(resources)
-        enable = self.data.get('enabled', True)
+        if self.data.get('enabled', True):
+            op = client.start_logging
+        else:
+            op = client.stop_logging
 
-        for r in resources:
-            if enable:
-                client.start_logging(Name=r['Name'])
-            else:
-                client.stop_logging(Name=r['Name'])
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(lambda r: op(Name=r['Name']), resources))
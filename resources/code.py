@@ -1,6 +1,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+
 from botocore.exceptions import ClientError
 
 from c7n.actions import BaseAction
@@ -53,8 +55,9 @@ class DeleteRepository(BaseAction):
     def process(self, repositories):
         client = local_session(
             self.manager.session_factory).client('codecommit')
-        for r in repositories:
-            self.process_repository(client, r)
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(
+                functools.partial(self.process_repository, client), repositories))
 
     def process_repository(self, client, repository):
         try:
@@ -138,8 +141,8 @@ class DeleteProject(BaseAction):
 
     def process(self, projects):
         client = local_session(self.manager.session_factory).client('codebuild')
-        for p in projects:
-            self.process_project(client, p)
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(functools.partial(self.process_project, client), projects))
 
     def process_project(self, client, project):
 
@@ -27,11 +27,15 @@ class Directory(QueryResourceManager):
         client = local_session(self.session_factory).client('ds')
 
         def _add_tags(d):
-            d['Tags'] = client.list_tags_for_resource(
-                ResourceId=d['DirectoryId']).get('Tags', [])
+            try:
+                d['Tags'] = client.list_tags_for_resource(
+                    ResourceId=d['DirectoryId']).get('Tags', [])
+            except client.exceptions.EntityDoesNotExistException:
+                return None
             return d
 
-        return list(map(_add_tags, directories))
+        with self.executor_factory(max_workers=3) as w:
+            return list(filter(None, w.map(_add_tags, directories)))
 
 
 @Directory.filter_registry.register('subnet')
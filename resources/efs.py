@@ -7,9 +7,10 @@ from c7n.actions import Action
 from c7n.filters.kms import KmsRelatedFilter
 from c7n.manager import resources
 from c7n.filters.vpc import SecurityGroupFilter, SubnetFilter
-from c7n.query import QueryResourceManager, ChildResourceManager
+from c7n.query import QueryResourceManager, ChildResourceManager, RetryPageIterator
 from c7n.tags import universal_augment, register_universal_tags
-from c7n.utils import local_session, type_schema, get_retry, generate_arn
+from c7n.utils import (
+    local_session, type_schema, get_retry, generate_arn, client_config)
 
 log = logging.getLogger('custodian.efs')
 
@@ -82,27 +83,33 @@ class SecurityGroup(SecurityGroupFilter):
     RelatedIdsExpression = ""
 
     def get_related_ids(self, resources):
+        if self.efs_group_cache is None:
+            self.efs_group_cache = {}
+        groups = self.efs_group_cache
 
-        if self.efs_group_cache:
-            group_ids = set()
-            for r in resources:
-                group_ids.update(
-                    self.efs_group_cache.get(r['MountTargetId'], ()))
-            return list(group_ids)
+        missing = [r['MountTargetId'] for r in resources
+                   if r['MountTargetId'] not in groups]
+        if missing:
+            client = local_session(self.manager.session_factory).client(
+                'efs', config=client_config(pool=10))
+            retry = get_retry(('Throttled',), 12)
 
-        client = local_session(self.manager.session_factory).client('efs')
-        groups = {}
-        group_ids = set()
-        retry = get_retry(('Throttled',), 12)
+            def _get_groups(mount_target_id):
+                return mount_target_id, retry(
+                    client.describe_mount_target_security_groups,
+                    MountTargetId=mount_target_id)['SecurityGroups']
+
+            # botocore's default connection pool holds 10 connections
+            with self.executor_factory(max_workers=10) as w:
+                groups.update(w.map(_get_groups, missing))
 
-        for r in resources:
-            groups[r['MountTargetId']] = retry(
-                client.describe_mount_target_security_groups,
-                MountTargetId=r['MountTargetId'])['SecurityGroups']
-            group_ids.update(groups[r['MountTargetId']])
+        return list(dict.fromkeys(
+            g for r in resources for g in groups[r['MountTargetId']]))
 
-        self.efs_group_cache = groups
-        return list(group_ids)
+    def process(self, resources, event=None):
+        # fetch every mount target's groups in one concurrent pass
+        self.get_related_ids(resources)
+        return super(SecurityGroup, self).process(resources, event)
 
 
 @ElasticFileSystem.filter_registry.register('kms-key')
@@ -136,17 +143,33 @@ class Delete(Action):
                    'efs:DeleteFileSystem')
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('efs')
+        client = local_session(self.manager.session_factory).client(
+            'efs', config=client_config(pool=10))
         self.unmount_filesystems(resources)
         retry = get_retry(('FileSystemInUse',), 12)
-        for r in resources:
-            retry(client.delete_file_system, FileSystemId=r['FileSystemId'])
+        with self.executor_factory(max_workers=10) as w:
+            list(w.map(
+                lambda r: retry(
+                    client.delete_file_system, FileSystemId=r['FileSystemId']),
+                resources))
 
     def unmount_filesystems(self, resources):
-        client = local_session(self.manager.session_factory).client('efs')
-        for r in resources:
-            if not r['NumberOfMountTargets']:
-                continue
-            for t in client.describe_mount_targets(
-                    FileSystemId=r['FileSystemId'])['MountTargets']:
-                client.delete_mount_target(MountTargetId=t['MountTargetId'])
+        client = local_session(self.manager.session_factory).client(
+            'efs', config=client_config(pool=10))
+        retry = get_retry(('Throttled',), 12)
+        mounted = [r['FileSystemId'] for r in resources
+                   if r['NumberOfMountTargets']]
+
+        paginator = client.get_paginator('describe_mount_targets')
+        paginator.PAGE_ITERATOR_CLS = RetryPageIterator
+
+        def _mount_targets(fs_id):
+            return paginator.paginate(
+                FileSystemId=fs_id).build_full_result()['MountTargets']
+
+        with self.executor_factory(max_workers=10) as w:
+            targets = [t['MountTargetId'] for fs_targets in
+                       w.map(_mount_targets, mounted) for t in fs_targets]
+            list(w.map(
+                lambda t: retry(client.delete_mount_target, MountTargetId=t),
+                targets))
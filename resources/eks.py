@@ -1,11 +1,13 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+
 from c7n.actions import Action
 from c7n.filters.vpc import SecurityGroupFilter, SubnetFilter, VpcFilter
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
-from c7n.utils import local_session, type_schema
+from c7n.utils import local_session, type_schema, client_config
 
 from .aws import shape_validate
 
@@ -70,15 +72,21 @@ class UpdateConfig(Action):
             cfg, self.shape, self.manager.resource_type.service)
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('eks')
+        client = local_session(self.manager.session_factory).client(
+            'eks', config=client_config(pool=3))
         state_filtered = 0
         params = dict(self.data)
         params.pop('type')
+        active = []
         for r in resources:
             if r['status'] != 'ACTIVE':
                 state_filtered += 1
                 continue
-            client.update_cluster_config(name=r['name'], **params)
+            active.append(r['name'])
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(
+                lambda name: client.update_cluster_config(name=name, **params),
+                active))
         if state_filtered:
             self.log.warning(
                 "Filtered %d of %d clusters due to state", state_filtered, len(resources))
@@ -91,9 +99,13 @@ class Delete(Action):
     permissions = ('eks:DeleteCluster',)
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('eks')
-        for r in resources:
-            try:
-                client.delete_cluster(name=r['name'])
-            except client.exceptions.ResourceNotFoundException:
-                continue
+        client = local_session(self.manager.session_factory).client(
+            'eks', config=client_config(pool=3))
+        with self.executor_factory(max_workers=3) as w:
+            list(w.map(functools.partial(self.delete_cluster, client), resources))
+
+    def delete_cluster(self, client, r):
+        try:
+            client.delete_cluster(name=r['name'])
+        except client.exceptions.ResourceNotFoundException:
+            pass
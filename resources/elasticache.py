@@ -3,7 +3,6 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import functools
 import logging
-import re
 
 from datetime import datetime
 
@@ -20,14 +19,17 @@ from c7n.query import QueryResourceManager
 from c7n.tags import universal_augment
 from c7n.utils import (
     local_session, generate_arn,
-    get_retry, chunks, snapshot_identifier, type_schema)
+    get_retry, chunks, snapshot_identifier, type_schema, client_config)
 
 log = logging.getLogger('custodian.elasticache')
 
 filters = FilterRegistry('elasticache.filters')
 actions = ActionRegistry('elasticache.actions')
 
-TTYPE = re.compile('cache.t1')
+UTC = tzutc()
+
+# concurrent api calls per action, also sizes the action client's pool
+ACTION_WORKERS = 16
 
 
 @resources.register('cache-cluster')
@@ -89,20 +91,19 @@ class SubnetFilter(net_filters.SubnetFilter):
     """
 
     RelatedIdsExpression = ""
+    groups = None
 
     def get_related_ids(self, resources):
-        group_ids = set()
-        for r in resources:
-            group_ids.update(
-                [s['SubnetIdentifier'] for s in
-                 self.groups[r['CacheSubnetGroupName']]['Subnets']])
-        return group_ids
+        return list(dict.fromkeys(
+            s['SubnetIdentifier'] for r in resources
+            for s in self.groups[r['CacheSubnetGroupName']]['Subnets']))
 
     def process(self, resources, event=None):
-        self.groups = {
-            r['CacheSubnetGroupName']: r for r in
-            self.manager.get_resource_manager(
-                'cache-subnet-group').resources()}
+        if self.groups is None:
+            self.groups = {
+                r['CacheSubnetGroupName']: r for r in
+                self.manager.get_resource_manager(
+                    'cache-subnet-group').resources()}
         return super(SubnetFilter, self).process(resources, event)
 
 
@@ -141,8 +142,7 @@ class DeleteElastiCacheCluster(BaseAction):
 
     def process(self, clusters):
         skip = self.data.get('skip-snapshot', False)
-        client = local_session(
-            self.manager.session_factory).client('elasticache')
+        client = _action_client(self.manager)
 
         clusters_to_delete = []
         replication_groups_to_delete = set()
@@ -152,6 +152,7 @@ class DeleteElastiCacheCluster(BaseAction):
             else:
                 clusters_to_delete.append(cluster)
         # added if statement to handle differences in parameters if snapshot is skipped
+        cluster_params = []
         for cluster in clusters_to_delete:
             params = {'CacheClusterId': cluster['CacheClusterId']}
             if _cluster_eligible_for_snapshot(cluster) and not skip:
@@ -162,22 +163,36 @@ class DeleteElastiCacheCluster(BaseAction):
             else:
                 self.log.debug(
                     "Skipping final snapshot of %s", cluster['CacheClusterId'])
-            client.delete_cache_cluster(**params)
-            self.log.info(
-                'Deleted ElastiCache cluster: %s',
-                cluster['CacheClusterId'])
+            cluster_params.append(params)
 
+        group_params = []
         for replication_group in replication_groups_to_delete:
             params = {'ReplicationGroupId': replication_group,
                       'RetainPrimaryCluster': False}
             if not skip:
                 params['FinalSnapshotIdentifier'] = snapshot_identifier(
                     'Final', replication_group)
-            client.delete_replication_group(**params)
+            group_params.append(params)
 
-            self.log.info(
-                'Deleted ElastiCache replication group: %s',
-                replication_group)
+        with self.executor_factory(max_workers=ACTION_WORKERS) as w:
+            futures = [w.submit(self.delete_cluster, client, params)
+                       for params in cluster_params]
+            futures.extend(w.submit(self.delete_replication_group, client, params)
+                           for params in group_params)
+            for f in as_completed(futures):
+                f.result()
+
+    def delete_cluster(self, client, params):
+        client.delete_cache_cluster(**params)
+        self.log.info(
+            'Deleted ElastiCache cluster: %s',
+            params['CacheClusterId'])
+
+    def delete_replication_group(self, client, params):
+        client.delete_replication_group(**params)
+        self.log.info(
+            'Deleted ElastiCache replication group: %s',
+            params['ReplicationGroupId'])
 
 
 @actions.register('snapshot')
@@ -211,9 +226,9 @@ class SnapshotElastiCacheCluster(BaseAction):
                 "action:snapshot implicitly filtered from %d to %d clusters for snapshot support",
                 set_size, len(clusters))
 
-        with self.executor_factory(max_workers=2) as w:
+        with self.executor_factory(max_workers=ACTION_WORKERS) as w:
             futures = []
-            client = local_session(self.manager.session_factory).client('elasticache')
+            client = _action_client(self.manager)
             for cluster in clusters:
                 futures.append(
                     w.submit(self.process_cluster_snapshot, client, cluster))
@@ -245,20 +260,21 @@ class ElasticacheClusterModifyVpcSecurityGroups(ModifyVpcSecurityGroupsAction):
     permissions = ('elasticache:ModifyReplicationGroup',)
 
     def process(self, clusters):
-        replication_group_map = {}
-        client = local_session(
-            self.manager.session_factory).client('elasticache')
+        client = _action_client(self.manager)
         groups = super(
             ElasticacheClusterModifyVpcSecurityGroups, self).get_groups(
                 clusters)
-        for idx, c in enumerate(clusters):
-            # build map of Replication Groups to Security Groups
-            replication_group_map[c['ReplicationGroupId']] = groups[idx]
+        # build map of Replication Groups to Security Groups
+        replication_group_map = dict(zip(
+            (c['ReplicationGroupId'] for c in clusters), groups))
 
-        for idx, r in enumerate(replication_group_map.keys()):
-            client.modify_replication_group(
-                ReplicationGroupId=r,
-                SecurityGroupIds=replication_group_map[r])
+        with self.executor_factory(max_workers=ACTION_WORKERS) as w:
+            list(w.map(
+                lambda rg: self.manager.retry(
+                    client.modify_replication_group,
+                    ReplicationGroupId=rg[0],
+                    SecurityGroupIds=rg[1]),
+                replication_group_map.items()))
 
 
 @resources.register('cache-subnet-group')
@@ -336,16 +352,9 @@ class ElastiCacheSnapshotAge(AgeFilter):
     def get_resource_date(self, snapshot):
         """ Override superclass method as there is no single snapshot date attribute.
         """
-        def to_datetime(v):
-            if not isinstance(v, datetime):
-                v = parse(v)
-            if not v.tzinfo:
-                v = v.replace(tzinfo=tzutc())
-            return v
-
         # Return the earliest of the node snaphot creation times.
-        return min([to_datetime(ns['SnapshotCreateTime'])
-                    for ns in snapshot['NodeSnapshots']])
+        return min(_to_datetime(ns['SnapshotCreateTime'])
+                   for ns in snapshot['NodeSnapshots'])
 
 
 @ElastiCacheSnapshot.action_registry.register('delete')
@@ -375,17 +384,17 @@ class DeleteElastiCacheSnapshot(BaseAction):
 
     def process(self, snapshots):
         log.info("Deleting %d ElastiCache snapshots", len(snapshots))
-        with self.executor_factory(max_workers=3) as w:
+        with self.executor_factory(max_workers=ACTION_WORKERS) as w:
             futures = []
-            client = local_session(self.manager.session_factory).client('elasticache')
+            client = _action_client(self.manager)
             for snapshot_set in chunks(reversed(snapshots), size=50):
                 futures.append(
                     w.submit(self.process_snapshot_set, client, snapshot_set))
-                for f in as_completed(futures):
-                    if f.exception():
-                        self.log.error(
-                            "Exception deleting snapshot set \n %s",
-                            f.exception())
+            for f in as_completed(futures):
+                if f.exception():
+                    self.log.error(
+                        "Exception deleting snapshot set \n %s",
+                        f.exception())
         return snapshots
 
     def process_snapshot_set(self, client, snapshots_set):
@@ -427,10 +436,13 @@ class CopyClusterTags(BaseAction):
         return perms
 
     def process(self, snapshots):
-        client = local_session(self.manager.session_factory).client('elasticache')
-        clusters = {r['CacheClusterId']: r for r in
-                    self.manager.get_resource_manager('cache-cluster').resources()}
-        copyable_tags = self.data.get('tags')
+        client = _action_client(self.manager)
+        cluster_tags = {
+            r['CacheClusterId']: {t['Key']: t['Value'] for t in r.get('Tags', ())}
+            for r in self.manager.get_resource_manager('cache-cluster').resources()}
+        copyable_tags = set(self.data.get('tags') or ())
+        generate_arn = self.manager.generate_arn
+        pending = []
 
         for s in snapshots:
             # For replicated/sharded clusters it is possible for each
@@ -443,41 +455,55 @@ class CopyClusterTags(BaseAction):
                 cluster_ids = [s['CacheClusterId']]
 
             copy_tags = {}
+            snap_tags = {t['Key']: t['Value'] for t in s.get('Tags', ())}
             for cid in sorted(cluster_ids):
-                if cid not in clusters:
+                if cid not in cluster_tags:
                     continue
 
-                cluster_tags = {t['Key']: t['Value'] for t in clusters[cid]['Tags']}
-                snap_tags = {t['Key']: t['Value'] for t in s.get('Tags', ())}
-
-                for k, v in cluster_tags.items():
-                    if copyable_tags and k not in copyable_tags:
-                        continue
-                    if k.startswith('aws:'):
-                        continue
-                    if snap_tags.get(k, '') == v:
-                        continue
-                    copy_tags[k] = v
+                copy_tags.update(
+                    (k, v) for k, v in cluster_tags[cid].items()
+                    if (not copyable_tags or k in copyable_tags) and
+                    not k.startswith('aws:') and
+                    snap_tags.get(k, '') != v)
 
             if not copy_tags:
                 continue
 
-            if len(set(copy_tags).union(set(snap_tags))) > 50:
+            if len(set(copy_tags).union(snap_tags)) > 50:
                 self.log.error(
                     "Cant copy tags, max tag limit hit on snapshot:%s",
                     s['SnapshotName'])
                 continue
 
-            arn = self.manager.generate_arn(s['SnapshotName'])
-            self.manager.retry(
-                client.add_tags_to_resource,
-                ResourceName=arn,
-                Tags=[{'Key': k, 'Value': v} for k, v in copy_tags.items()])
+            pending.append((
+                generate_arn(s['SnapshotName']),
+                [{'Key': k, 'Value': v} for k, v in copy_tags.items()]))
+
+        with self.executor_factory(max_workers=ACTION_WORKERS) as w:
+            list(w.map(
+                lambda arn_tags: self.manager.retry(
+                    client.add_tags_to_resource,
+                    ResourceName=arn_tags[0],
+                    Tags=arn_tags[1]),
+                pending))
+
+
+def _to_datetime(v):
+    if not isinstance(v, datetime):
+        v = parse(v)
+    if not v.tzinfo:
+        v = v.replace(tzinfo=UTC)
+    return v
+
+
+def _action_client(manager):
+    return local_session(manager.session_factory).client(
+        'elasticache', config=client_config(pool=ACTION_WORKERS))
 
 
 def _cluster_eligible_for_snapshot(cluster):
-    # added regex search to filter unsupported cachenode types
+    # t1 cache node types don't support snapshots
     return (
         cluster['Engine'] != 'memcached' and not
-        TTYPE.match(cluster['CacheNodeType'])
+        cluster['CacheNodeType'].startswith('cache.t1')
     )
@@ -11,10 +11,12 @@ from c7n.filters.vpc import SecurityGroupFilter, SubnetFilter, VpcFilter
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
 from c7n.utils import (
-    chunks, local_session, get_retry, type_schema, generate_arn)
+    chunks, local_session, get_retry, type_schema, generate_arn, unique_by,
+    client_config)
 from c7n.tags import Tag, RemoveTag, TagActionFilter, TagDelayedAction
 
 log = logging.getLogger('custodian.es')
+
 filters = FilterRegistry('es.filters')
 filters.register('marked-for-op', TagActionFilter)
 
@@ -35,17 +37,27 @@ class ElasticSearchDomain(QueryResourceManager):
     filter_registry = filters
     _generate_arn = _account_id = None
     retry = staticmethod(get_retry(('Throttled',)))
+    # describe_elasticsearch_domains accepts at most 5 names per call
+    describe_chunk_size = 5
+    augment_workers = 8
 
     @property
     def generate_arn(self):
         if self._generate_arn is None:
-            self._generate_arn = functools.partial(
+            arns = {}
+            arn_for = functools.partial(
                 generate_arn,
                 'es',
                 region=self.config.region,
                 account_id=self.config.account_id,
                 resource_type='domain',
                 separator='/')
+
+            def _generate_arn(domain_name):
+                if domain_name not in arns:
+                    arns[domain_name] = arn_for(domain_name)
+                return arns[domain_name]
+            self._generate_arn = _generate_arn
         return self._generate_arn
 
     def get_resources(self, resource_ids):
@@ -54,22 +66,31 @@ class ElasticSearchDomain(QueryResourceManager):
             DomainNames=resource_ids)['DomainStatusList']
 
     def augment(self, domains):
-        client = local_session(self.session_factory).client('es')
+        client = local_session(self.session_factory).client(
+            'es', config=client_config(pool=self.augment_workers))
         model = self.get_model()
 
-        def _augment(resource_set):
-            resources = self.retry(
+        generate_arn = self.generate_arn
+
+        def _describe(resource_set):
+            return self.retry(
                 client.describe_elasticsearch_domains,
                 DomainNames=resource_set)['DomainStatusList']
-            for r in resources:
-                rarn = self.generate_arn(r[model.id])
-                r['Tags'] = self.retry(
-                    client.list_tags, ARN=rarn).get('TagList', [])
-            return resources
 
-        with self.executor_factory(max_workers=1) as w:
-            return list(itertools.chain(
-                *w.map(_augment, chunks(domains, 5))))
+        def _add_tags(r):
+            # describe normally returns the arn, the tag actions rely on it
+            if 'ARN' not in r:
+                r['ARN'] = generate_arn(r[model.id])
+            r['Tags'] = self.retry(
+                client.list_tags, ARN=r['ARN']).get('TagList', [])
+
+        with self.executor_factory(max_workers=self.augment_workers) as w:
+            resources = list(itertools.chain.from_iterable(
+                w.map(_describe, chunks(domains, self.describe_chunk_size))))
+            # tag lookups are per domain, fan them out across the pool
+            # rather than serially within each describe chunk
+            list(w.map(_add_tags, resources))
+        return resources
 
 
 @ElasticSearchDomain.filter_registry.register('subnet')
@@ -105,16 +126,22 @@ class ElasticSearchModifySG(ModifyVpcSecurityGroupsAction):
     """Modify security groups on an Elasticsearch domain"""
 
     permissions = ('es:UpdateElasticsearchDomainConfig',)
+    concurrency = 5
 
     def process(self, domains):
+        domains = unique_by(domains, 'DomainName')
         groups = super(ElasticSearchModifySG, self).get_groups(domains)
-        client = local_session(self.manager.session_factory).client('es')
+        client = local_session(self.manager.session_factory).client(
+            'es', config=client_config(pool=self.concurrency))
 
-        for dx, d in enumerate(domains):
-            client.update_elasticsearch_domain_config(
-                DomainName=d['DomainName'],
-                VPCOptions={
-                    'SecurityGroupIds': groups[dx]})
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(
+                lambda d_groups: self.manager.retry(
+                    client.update_elasticsearch_domain_config,
+                    DomainName=d_groups[0]['DomainName'],
+                    VPCOptions={
+                        'SecurityGroupIds': d_groups[1]}),
+                zip(domains, groups)))
 
 
 @ElasticSearchDomain.action_registry.register('delete')
@@ -122,11 +149,17 @@ class Delete(Action):
 
     schema = type_schema('delete')
     permissions = ('es:DeleteElastisearchDomain',)
+    concurrency = 5
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('es')
-        for r in resources:
-            client.delete_elasticsearch_domain(DomainName=r['DomainName'])
+        resources = unique_by(resources, 'DomainName')
+        client = local_session(self.manager.session_factory).client(
+            'es', config=client_config(pool=self.concurrency))
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(
+                lambda r: client.delete_elasticsearch_domain(
+                    DomainName=r['DomainName']),
+                resources))
 
 
 @ElasticSearchDomain.action_registry.register('tag')
@@ -153,7 +186,7 @@ class ElasticSearchAddTag(Tag):
         for d in domains:
             try:
                 client.add_tags(ARN=d['ARN'], TagList=tags)
-            except client.exceptions.ResourceNotFoundExecption:
+            except client.exceptions.ResourceNotFoundException:
                 continue
 
 
@@ -180,7 +213,7 @@ class ElasticSearchRemoveTag(RemoveTag):
         for d in domains:
             try:
                 client.remove_tags(ARN=d['ARN'], TagKeys=tags)
-            except client.exceptions.ResourceNotFoundExecption:
+            except client.exceptions.ResourceNotFoundException:
                 continue
 
 
@@ -25,16 +25,26 @@ class CloudHSMCluster(QueryResourceManager):
         # Note: resourcegroupstaggingapi still points to hsm-classic
 
     augment = universal_augment
+    _generate_arn = None
 
     @property
     def generate_arn(self):
-        return functools.partial(
-            generate_arn,
-            'cloudhsm',
-            region=self.config.region,
-            account_id=self.account_id,
-            resource_type='cluster',
-            separator='/')
+        if self._generate_arn is None:
+            arns = {}
+            arn_for = functools.partial(
+                generate_arn,
+                'cloudhsm',
+                region=self.config.region,
+                account_id=self.account_id,
+                resource_type='cluster',
+                separator='/')
+
+            def _generate_arn(cluster_id):
+                if cluster_id not in arns:
+                    arns[cluster_id] = arn_for(cluster_id)
+                return arns[cluster_id]
+            self._generate_arn = _generate_arn
+        return self._generate_arn
 
 
 @CloudHSMCluster.action_registry.register('tag')
@@ -1,11 +1,13 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+
 from c7n.actions import Action
 from c7n.filters.vpc import SecurityGroupFilter, SubnetFilter
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
-from c7n.utils import local_session, type_schema
+from c7n.utils import local_session, type_schema, unique_by, client_config
 
 
 @resources.register('kafka')
@@ -39,12 +41,17 @@ class Delete(Action):
 
     schema = type_schema('delete')
     permissions = ('kafka:DeleteCluster',)
+    concurrency = 5
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('kafka')
-
-        for r in resources:
-            try:
-                client.delete_cluster(ClusterArn=r['ClusterArn'])
-            except client.exceptions.NotFoundException:
-                continue
+        resources = unique_by(resources, 'ClusterArn')
+        client = local_session(self.manager.session_factory).client(
+            'kafka', config=client_config(pool=self.concurrency))
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(functools.partial(self.process_cluster, client), resources))
+
+    def process_cluster(self, client, r):
+        try:
+            client.delete_cluster(ClusterArn=r['ClusterArn'])
+        except client.exceptions.NotFoundException:
+            pass
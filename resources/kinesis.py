@@ -1,13 +1,16 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+
 import jmespath
 
 from c7n.actions import Action
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
 from c7n.tags import universal_augment
-from c7n.utils import local_session, type_schema, get_retry
+from c7n.utils import (
+    local_session, type_schema, get_retry, unique_by, client_config)
 
 
 @resources.register('kinesis')
@@ -42,21 +45,26 @@ class Encrypt(Action):
                          required=('key',))
 
     permissions = ("kinesis:UpdateStream",)
+    concurrency = 5
 
     def process(self, resources):
-        # get KeyId
-        key = "alias/" + self.data.get('key')
-        self.key_id = local_session(self.manager.session_factory).client(
-            'kms').describe_key(KeyId=key)['KeyMetadata']['KeyId']
-        client = local_session(self.manager.session_factory).client('kinesis')
-        for r in resources:
-            if not r['StreamStatus'] == 'ACTIVE':
-                continue
-            client.start_stream_encryption(
-                StreamName=r['StreamName'],
-                EncryptionType='KMS',
-                KeyId=self.key_id
-            )
+        resources = unique_by(resources, 'StreamName')
+        # resolve the alias on every run, it may have been retargeted
+        key_id = local_session(self.manager.session_factory).client(
+            'kms').describe_key(
+                KeyId="alias/" + self.data.get('key'))['KeyMetadata']['KeyId']
+        client = local_session(self.manager.session_factory).client(
+            'kinesis', config=client_config(pool=self.concurrency))
+        active = [r['StreamName'] for r in resources
+                  if r['StreamStatus'] == 'ACTIVE']
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(
+                lambda name: self.manager.retry(
+                    client.start_stream_encryption,
+                    StreamName=name,
+                    EncryptionType='KMS',
+                    KeyId=key_id),
+                active))
 
 
 @KinesisStream.action_registry.register('delete')
@@ -64,19 +72,25 @@ class Delete(Action):
 
     schema = type_schema('delete')
     permissions = ("kinesis:DeleteStream",)
+    concurrency = 5
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('kinesis')
-        not_active = [r['StreamName'] for r in resources
-                      if r['StreamStatus'] != 'ACTIVE']
-        self.log.warning(
-            "The following streams cannot be deleted (wrong state): %s" % (
-                ", ".join(not_active)))
+        resources = unique_by(resources, 'StreamName')
+        client = local_session(self.manager.session_factory).client(
+            'kinesis', config=client_config(pool=self.concurrency))
+        active, not_active = [], []
         for r in resources:
-            if not r['StreamStatus'] == 'ACTIVE':
-                continue
-            client.delete_stream(
-                StreamName=r['StreamName'])
+            (active if r['StreamStatus'] == 'ACTIVE' else not_active).append(
+                r['StreamName'])
+        if not_active:
+            self.log.warning(
+                "The following streams cannot be deleted (wrong state): %s" % (
+                    ", ".join(not_active)))
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(
+                lambda name: self.manager.retry(
+                    client.delete_stream, StreamName=name),
+                active))
 
 
 @resources.register('firehose')
@@ -86,6 +100,13 @@ class DeliveryStream(QueryResourceManager):
         service = 'firehose'
         type = 'deliverystream'
         enum_spec = ('list_delivery_streams', 'DeliveryStreamNames', None)
+        # no botocore paginator, the api returns at most 10 names a call
+        enum_pagination = {
+            'input_token': 'ExclusiveStartDeliveryStreamName',
+            'output_token': 'DeliveryStreamNames[-1]',
+            'more_results': 'HasMoreDeliveryStreams',
+            'limit_key': 'Limit',
+            'result_key': 'DeliveryStreamNames'}
         detail_spec = (
             'describe_delivery_stream', 'DeliveryStreamName', None,
             'DeliveryStreamDescription')
@@ -101,20 +122,26 @@ class FirehoseDelete(Action):
 
     schema = type_schema('delete')
     permissions = ("firehose:DeleteDeliveryStream",)
+    concurrency = 5
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('firehose')
-        creating = [r['DeliveryStreamName'] for r in resources
-                    if r['DeliveryStreamStatus'] == 'CREATING']
+        resources = unique_by(resources, 'DeliveryStreamName')
+        client = local_session(self.manager.session_factory).client(
+            'firehose', config=client_config(pool=self.concurrency))
+        active, creating = [], []
+        for r in resources:
+            if r['DeliveryStreamStatus'] == 'ACTIVE':
+                active.append(r['DeliveryStreamName'])
+            elif r['DeliveryStreamStatus'] == 'CREATING':
+                creating.append(r['DeliveryStreamName'])
         if creating:
             self.log.warning(
                 "These delivery streams can't be deleted (wrong state): %s" % (
                     ", ".join(creating)))
-        for r in resources:
-            if not r['DeliveryStreamStatus'] == 'ACTIVE':
-                continue
-            client.delete_delivery_stream(
-                DeliveryStreamName=r['DeliveryStreamName'])
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(
+                lambda name: client.delete_delivery_stream(DeliveryStreamName=name),
+                active))
 
 
 @DeliveryStream.action_registry.register('encrypt-s3-destination')
@@ -139,66 +166,74 @@ class FirehoseEncryptS3Destination(Action):
         key_arn={'type': 'string'}, required=('key_arn',))
 
     permissions = ("firehose:UpdateDestination",)
+    concurrency = 5
 
     DEST_MD = {
         'SplunkDestinationDescription': {
             'update': 'SplunkDestinationUpdate',
             'clear': ['S3BackupMode'],
-            'encrypt_path': 'S3DestinationDescription.EncryptionConfiguration',
+            'encrypt_path': jmespath.compile(
+                'S3DestinationDescription.EncryptionConfiguration'),
             'remap': [('S3DestinationDescription', 'S3Update')]
         },
         'ElasticsearchDestinationDescription': {
             'update': 'ElasticsearchDestinationUpdate',
             'clear': ['S3BackupMode'],
-            'encrypt_path': 'S3DestinationDescription.EncryptionConfiguration',
+            'encrypt_path': jmespath.compile(
+                'S3DestinationDescription.EncryptionConfiguration'),
             'remap': [('S3DestinationDescription', 'S3Update')],
         },
         'ExtendedS3DestinationDescription': {
             'update': 'ExtendedS3DestinationUpdate',
             'clear': ['S3BackupMode'],
-            'encrypt_path': 'EncryptionConfiguration',
+            'encrypt_path': jmespath.compile('EncryptionConfiguration'),
             'remap': []
         },
         'RedshiftDestinationDescription': {
             'update': 'RedshiftDestinationUpdate',
             'clear': ['S3BackupMode', "ClusterJDBCURL", "CopyCommand", "Username"],
-            'encrypt_path': 'S3DestinationDescription.EncryptionConfiguration',
+            'encrypt_path': jmespath.compile(
+                'S3DestinationDescription.EncryptionConfiguration'),
             'remap': [('S3DestinationDescription', 'S3Update')]
         },
     }
 
     def process(self, resources):
-        client = local_session(self.manager.session_factory).client('firehose')
+        resources = unique_by(resources, 'DeliveryStreamName')
+        client = local_session(self.manager.session_factory).client(
+            'firehose', config=client_config(pool=self.concurrency))
+        active = [r for r in resources if r['DeliveryStreamStatus'] == 'ACTIVE']
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(functools.partial(self.process_stream, client), active))
+
+    def process_stream(self, client, r):
         key = self.data.get('key_arn')
-        for r in resources:
-            if not r['DeliveryStreamStatus'] == 'ACTIVE':
+        version = r['VersionId']
+        name = r['DeliveryStreamName']
+        d = r['Destinations'][0]
+        destination_id = d['DestinationId']
+
+        for dtype, dmetadata in self.DEST_MD.items():
+            if dtype not in d:
                 continue
-            version = r['VersionId']
-            name = r['DeliveryStreamName']
-            d = r['Destinations'][0]
-            destination_id = d['DestinationId']
-
-            for dtype, dmetadata in self.DEST_MD.items():
-                if dtype not in d:
-                    continue
-                dinfo = d[dtype]
-                for k in dmetadata['clear']:
-                    dinfo.pop(k, None)
-                if dmetadata['encrypt_path']:
-                    encrypt_info = jmespath.search(dmetadata['encrypt_path'], dinfo)
-                else:
-                    encrypt_info = dinfo
-                encrypt_info.pop('NoEncryptionConfig', None)
-                encrypt_info['KMSEncryptionConfig'] = {'AWSKMSKeyARN': key}
-
-                for old_k, new_k in dmetadata['remap']:
-                    if old_k in dinfo:
-                        dinfo[new_k] = dinfo.pop(old_k)
-                params = dict(DeliveryStreamName=name,
-                              DestinationId=destination_id,
-                              CurrentDeliveryStreamVersionId=version)
-                params[dmetadata['update']] = dinfo
-                client.update_destination(**params)
+            dinfo = d[dtype]
+            for k in dmetadata['clear']:
+                dinfo.pop(k, None)
+            if dmetadata['encrypt_path']:
+                encrypt_info = dmetadata['encrypt_path'].search(dinfo)
+            else:
+                encrypt_info = dinfo
+            encrypt_info.pop('NoEncryptionConfig', None)
+            encrypt_info['KMSEncryptionConfig'] = {'AWSKMSKeyARN': key}
+
+            for old_k, new_k in dmetadata['remap']:
+                if old_k in dinfo:
+                    dinfo[new_k] = dinfo.pop(old_k)
+            params = dict(DeliveryStreamName=name,
+                          DestinationId=destination_id,
+                          CurrentDeliveryStreamVersionId=version)
+            params[dmetadata['update']] = dinfo
+            client.update_destination(**params)
 
 
 @resources.register('kinesis-analytics')
@@ -207,6 +242,13 @@ class AnalyticsApp(QueryResourceManager):
     class resource_type(object):
         service = "kinesisanalytics"
         enum_spec = ('list_applications', 'ApplicationSummaries', None)
+        # no botocore paginator, the api returns at most 50 apps a call
+        enum_pagination = {
+            'input_token': 'ExclusiveStartApplicationName',
+            'output_token': 'ApplicationSummaries[-1].ApplicationName',
+            'more_results': 'HasMoreApplications',
+            'limit_key': 'Limit',
+            'result_key': 'ApplicationSummaries'}
         detail_spec = ('describe_application', 'ApplicationName',
                        'ApplicationName', 'ApplicationDetail')
         name = "ApplicationName"
@@ -221,11 +263,16 @@ class AppDelete(Action):
 
     schema = type_schema('delete')
     permissions = ("kinesisanalytics:DeleteApplication",)
+    concurrency = 5
 
     def process(self, resources):
+        resources = unique_by(resources, 'ApplicationName')
         client = local_session(
-            self.manager.session_factory).client('kinesisanalytics')
-        for r in resources:
-            client.delete_application(
-                ApplicationName=r['ApplicationName'],
-                CreateTimestamp=r['CreateTimestamp'])
+            self.manager.session_factory).client(
+                'kinesisanalytics', config=client_config(pool=self.concurrency))
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            list(w.map(
+                lambda r: client.delete_application(
+                    ApplicationName=r['ApplicationName'],
+                    CreateTimestamp=r['CreateTimestamp']),
+                resources))
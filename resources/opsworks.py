@@ -1,12 +1,15 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
+from concurrent.futures import as_completed
+
 from botocore.exceptions import ClientError
 
 from c7n.actions import BaseAction
 from c7n.manager import resources
 from c7n.query import QueryResourceManager
-from c7n.utils import local_session, type_schema
+from c7n.utils import local_session, type_schema, unique_by, client_config
 from c7n import utils
 
 
@@ -73,18 +76,67 @@ class DeleteStack(BaseAction, StateTransitionFilter):
         "opsworks:DeleteApp", "opsworks:DeleteLayer",
         "opsworks:DeleteInstance")
 
-    def process(self, stacks):
-        with self.executor_factory(max_workers=2) as w:
-            list(w.map(self.process_stack, stacks))
+    # Validation Exception raised for instances that are stopping when delete is called
+    retryable = ('ValidationException',)
+    retry = staticmethod(utils.get_retry(retryable, max_attempts=8))
+    # Stacks deleted at once, each running up to concurrency app/instance
+    # and layer deletes, so up to stack_concurrency * concurrency calls
+    # are in flight on the shared client. The describe prefetch before
+    # that uses describe_concurrency workers.
+    stack_concurrency = 2
+    concurrency = 5
+    describe_concurrency = 10
+    child_describes = (
+        ('describe_apps', 'Apps'),
+        ('describe_instances', 'Instances'),
+        ('describe_layers', 'Layers'))
 
-    def process_stack(self, stack):
+    def process(self, stacks):
+        stacks = unique_by(stacks, 'StackId')
         client = local_session(
-            self.manager.session_factory).client('opsworks')
+            self.manager.session_factory).client(
+            'opsworks', config=client_config(pool=max(
+                self.describe_concurrency,
+                self.stack_concurrency * self.concurrency)))
+        children = self.describe_children(client, stacks)
+        with self.executor_factory(max_workers=self.stack_concurrency) as w:
+            futures = [
+                w.submit(self.process_stack, client, s, children[s['StackId']])
+                for s in stacks if s['StackId'] in children]
+            for f in as_completed(futures):
+                f.result()
+
+    def describe_children(self, client, stacks):
+        """Fetch apps, instances and layers for all stacks up front.
+
+        Returns a mapping of stack id to (apps, instances, layers), stacks
+        whose describes failed are logged and left out.
+        """
+        results, failed = {}, set()
+        with self.executor_factory(max_workers=self.describe_concurrency) as w:
+            futures = {}
+            for s in stacks:
+                for op, key in self.child_describes:
+                    f = w.submit(getattr(client, op), StackId=s['StackId'])
+                    futures[f] = (s['StackId'], key)
+            for f in as_completed(futures):
+                stack_id, key = futures[f]
+                e = f.exception()
+                if e is None:
+                    results.setdefault(stack_id, {})[key] = f.result()[key]
+                elif not isinstance(e, ClientError):
+                    raise e
+                elif stack_id not in failed:
+                    failed.add(stack_id)
+                    self.log.exception(
+                        "Exception describing stack:%s\n %s" % (stack_id, e))
+        return {stack_id: (r['Apps'], r['Instances'], r['Layers'])
+                for stack_id, r in results.items() if stack_id not in failed}
+
+    def process_stack(self, client, stack, children):
+        apps, instances, layers = children
         try:
             stack_id = stack['StackId']
-            for app in client.describe_apps(StackId=stack_id)['Apps']:
-                client.delete_app(AppId=app['AppId'])
-            instances = client.describe_instances(StackId=stack_id)['Instances']
             orig_length = len(instances)
             instances = self.filter_instance_state(instances)
             if(len(instances) != orig_length):
@@ -92,24 +144,35 @@ class DeleteStack(BaseAction, StateTransitionFilter):
                     "All instances must be stopped before deletion. Stack Id: %s Name: %s." %
                     (stack_id, stack['Name']))
                 return
-            for instance in instances:
-                instance_id = instance['InstanceId']
-                # Validation Exception raised for instances that are stopping when delete is called
-                retryable = ('ValidationException'),
-                retry = utils.get_retry(retryable, max_attempts=8)
-                try:
-                    retry(client.delete_instance, InstanceId=instance_id)
-                except ClientError as e2:
-                    if e2.response['Error']['Code'] in retryable:
-                        return True
-                    raise
-            for layer in client.describe_layers(StackId=stack_id)['Layers']:
-                client.delete_layer(LayerId=layer['LayerId'])
+
+            # layers can only be removed once their instances are gone
+            with self.executor_factory(max_workers=self.concurrency) as w:
+                futures = [w.submit(client.delete_app, AppId=a['AppId'])
+                           for a in apps]
+                deleted = all(w.map(
+                    functools.partial(self.delete_instance, client), instances))
+                for f in futures:
+                    f.result()
+            if not deleted:
+                return True
+            with self.executor_factory(max_workers=self.concurrency) as w:
+                list(w.map(
+                    lambda layer: client.delete_layer(LayerId=layer['LayerId']),
+                    layers))
             client.delete_stack(StackId=stack_id)
         except ClientError as e:
             self.log.exception(
                 "Exception deleting stack:\n %s" % e)
 
+    def delete_instance(self, client, instance):
+        try:
+            self.retry(client.delete_instance, InstanceId=instance['InstanceId'])
+        except ClientError as e:
+            if e.response['Error']['Code'] in self.retryable:
+                return False
+            raise
+        return True
+
 
 @OpsworkStack.action_registry.register('stop')
 class StopStack(BaseAction):
@@ -130,14 +193,19 @@ class StopStack(BaseAction):
 
     schema = type_schema('stop')
     permissions = ("opsworks:StopStack",)
+    concurrency = 10
 
     def process(self, stacks):
-        with self.executor_factory(max_workers=10) as w:
-            list(w.map(self.process_stack, stacks))
-
-    def process_stack(self, stack):
+        stacks = unique_by(stacks, 'StackId')
         client = local_session(
-            self.manager.session_factory).client('opsworks')
+            self.manager.session_factory).client(
+            'opsworks', config=client_config(pool=self.concurrency))
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            futures = [w.submit(self.process_stack, client, s) for s in stacks]
+            for f in as_completed(futures):
+                f.result()
+
+    def process_stack(self, client, stack):
         try:
             stack_id = stack['StackId']
             client.stop_stack(StackId=stack_id)
@@ -179,14 +247,19 @@ class CMDelete(BaseAction):
 
     schema = type_schema('delete')
     permissions = ("opsworks-cm:DeleteServer",)
+    concurrency = 2
 
     def process(self, servers):
-        with self.executor_factory(max_workers=2) as w:
-            list(w.map(self.process_server, servers))
-
-    def process_server(self, server):
+        servers = unique_by(servers, 'ServerName')
         client = local_session(
-            self.manager.session_factory).client('opsworkscm')
+            self.manager.session_factory).client(
+            'opsworkscm', config=client_config(pool=self.concurrency))
+        with self.executor_factory(max_workers=self.concurrency) as w:
+            futures = [w.submit(self.process_server, client, s) for s in servers]
+            for f in as_completed(futures):
+                f.result()
+
+    def process_server(self, client, server):
         try:
             client.delete_server(ServerName=server['ServerName'])
         except ClientError as e:
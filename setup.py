@@ -24,13 +24,14 @@ setup(
         'console_scripts': [
             'custodian = c7n.cli:main']},
     install_requires=[
-        "boto3>=1.9.94",
-        "botocore>=1.12.94",
+        "boto3>=1.12.0",
+        "botocore>=1.15.0",
         "python-dateutil>=2.6,<3.0.0",
         "PyYAML>=4.2b4",
-        "jsonschema",
+        "jsonschema>=3.0.0",
         "jsonpatch>=1.21",
         "argcomplete",
-        "tabulate>=0.8.2"
+        "tabulate>=0.8.2",
+        "requests>=2.20.0"
     ],
 )
@@ -20,6 +20,9 @@ import unittest
 import uuid
 from functools import partial
 
+import mock
+
+from c7n.executor import MainThreadExecutor
 from c7n.schema import generate
 from c7n.resources import load_resources
 from c7n.config import Bag, Config
@@ -68,6 +71,46 @@ class BaseTest(TestUtils, PillTest):
     def account_id(self):
         return ACCOUNT_ID
 
+    def mock_client(self, module):
+        """Have a resource module's local_session hand out a mock client.
+
+        Returns the client for the test to stub api calls on.
+        """
+        client = mock.MagicMock()
+        session = mock.MagicMock()
+        session.client.return_value = client
+        self.patch(module, "local_session", lambda factory: session)
+        return client
+
+    def record_executor(self, klass):
+        """Run klass's executor_factory on the main thread, recording its use.
+
+        Returns a list of the executors created, each with the max_workers
+        it was sized with and the work it was handed, one entry per mapped
+        item or per submit call's arguments.
+        """
+        executors = []
+
+        class RecordingExecutor(MainThreadExecutor):
+
+            def __init__(self, *args, **kw):
+                super(RecordingExecutor, self).__init__(*args, **kw)
+                self.max_workers = kw.get("max_workers", args and args[0] or None)
+                self.work = []
+                executors.append(self)
+
+            def map(self, func, iterable):
+                items = list(iterable)
+                self.work.extend(items)
+                return super(RecordingExecutor, self).map(func, items)
+
+            def submit(self, func, *args, **kw):
+                self.work.append(args)
+                return super(RecordingExecutor, self).submit(func, *args, **kw)
+
+        self.patch(klass, "executor_factory", RecordingExecutor)
+        return executors
+
 
 class ConfigTest(BaseTest):
     """Test base class for integration tests with aws config.
@@ -17,6 +17,8 @@ from .common import BaseTest
 from c7n.provider import clouds
 from c7n.exceptions import PolicyValidationError
 from c7n.executor import MainThreadExecutor
+from c7n.filters.missing import Missing
+from c7n.policy import Policy
 from c7n.utils import local_session
 from jsonschema.exceptions import ValidationError
 
@@ -82,6 +84,42 @@ class AccountTests(BaseTest):
         resources = p.run()
         self.assertEqual(len(resources), 1)
 
+    def test_missing_regions_polled_concurrently(self):
+        regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2", "eu-west-1"]
+        polled = []
+        missing_in = set()
+
+        def poll(policy):
+            polled.append(policy.options.region)
+            if policy.options.region in missing_in:
+                return []
+            return [{"FunctionName": "f"}]
+
+        self.patch(Policy, "poll", poll)
+        executors = self.record_executor(Missing)
+        p = self.load_policy({
+            'name': 'missing-lambda',
+            'resource': 'aws.account',
+            'filters': [{
+                'type': 'missing',
+                'policy': {'resource': 'aws.lambda'}}]},
+            config=Config.empty(regions=regions))
+        f = p.resource_manager.filters[0]
+        accounts = [{'account_id': '644160558196'}]
+
+        # present everywhere, every region is polled exactly once
+        self.assertEqual(f.process(accounts), [])
+        self.assertEqual(sorted(polled), sorted(regions))
+        # one poll per region is submitted to a pool as wide as the regions
+        self.assertEqual([e.max_workers for e in executors], [len(regions)])
+        self.assertEqual(len(executors[0].work), len(regions))
+
+        missing_in.add("us-west-1")
+        del polled[:]
+        self.assertEqual(f.process(accounts), accounts)
+        self.assertIn("us-west-1", polled)
+        self.assertEqual(len(polled), len(set(polled)))
+
     def test_guard_duty_filter(self):
         factory = self.replay_flight_data('test_account_guard_duty_filter')
         p = self.load_policy({
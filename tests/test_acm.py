@@ -13,11 +13,41 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from c7n.resources import acm
+
 from .common import BaseTest
 
 
 class CertificateTest(BaseTest):
 
+    def test_certificate_delete_concurrent(self):
+        class ResourceNotFoundException(Exception):
+            pass
+
+        class ResourceInUseException(Exception):
+            pass
+
+        def delete(CertificateArn):
+            if CertificateArn == "arn:cert-3":
+                raise ResourceNotFoundException()
+            if CertificateArn == "arn:cert-4":
+                raise ResourceInUseException()
+
+        client = self.mock_client(acm)
+        client.exceptions.ResourceNotFoundException = ResourceNotFoundException
+        client.exceptions.ResourceInUseException = ResourceInUseException
+        client.delete_certificate.side_effect = delete
+        executors = self.record_executor(acm.CertificateDeleteAction)
+        p = self.load_policy(
+            {"name": "acm-delete", "resource": "acm-certificate", "actions": ["delete"]})
+        certs = [{"CertificateArn": "arn:cert-%d" % i} for i in range(20)]
+        output = self.capture_logging("custodian.actions")
+        p.resource_manager.actions[0].process(certs)
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(executors[0].work, certs)
+        self.assertEqual(client.delete_certificate.call_count, 20)
+        self.assertIn("arn:cert-4", output.getvalue())
+
     def test_certificate_augment(self):
         factory = self.replay_flight_data("test_acm_certificate_augment")
         p = self.load_policy({
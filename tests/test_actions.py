@@ -13,9 +13,19 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import base64
+import gc
+import gzip
+import io
+import mock
+import weakref
+
 from botocore.exceptions import ClientError
+from c7n import utils
 from c7n.exceptions import PolicyValidationError
 from c7n.actions import Action, ActionRegistry
+from c7n.actions import invoke
+from c7n.actions.invoke import LambdaInvoke, GzipBatch, dumps
 from .common import BaseTest
 
 
@@ -51,3 +61,146 @@ class ActionRegistryTest(BaseTest):
         self.assertRaises(
             PolicyValidationError, ActionRegistry("test.actions").factory, "foo", None
         )
+
+
+class LambdaInvokeTest(BaseTest):
+
+    def decode_payload(self, payload):
+        # small batches are sent raw, larger ones in a gzip envelope
+        envelope = utils.loads(payload)
+        if '_c' not in envelope:
+            return envelope
+        self.assertEqual(envelope['_c'], 'gz')
+        return utils.loads(gzip.GzipFile(
+            fileobj=io.BytesIO(base64.b64decode(envelope['_d']))).read())
+
+    def test_gzip_batch_payload(self):
+        resources = [{'InstanceId': 'i-%d' % i} for i in range(100)]
+        batch = GzipBatch(b'{"resources":[', b']}')
+        for r in resources:
+            batch.add(dumps(r))
+        payload = batch.payload()
+        self.assertEqual(utils.loads(payload)['_c'], 'gz')
+        self.assertEqual(self.decode_payload(payload), {'resources': resources})
+        self.assertTrue(len(payload) < len(dumps({'resources': resources})))
+
+    def test_batches_by_payload_size(self):
+        resources = [{'InstanceId': 'i-%04d' % i} for i in range(10)]
+        resource_size = len(dumps(resources[0])) + 1
+
+        action = LambdaInvoke({
+            'function': 'xyz',
+            'max_payload_size': 100 + resource_size * 4})
+        batches = list(action.get_batches(100, resources))
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
+        self.assertEqual(utils.loads(batches[2][0]), resources[8])
+
+        action.data['batch_size'] = 3
+        self.assertEqual(
+            [len(b) for b in action.get_batches(100, resources)], [3, 3, 3, 1])
+
+    def test_compressed_batches_by_compressed_size(self):
+        resources = [
+            {'InstanceId': 'i-%04d' % i, 'State': {'Name': 'running'},
+             'Tags': [{'Key': 'Name', 'Value': 'app-server'}]}
+            for i in range(500)]
+        head, tail = b'{"resources":[', b']}'
+        action = LambdaInvoke({
+            'function': 'xyz', 'max_payload_size': 4000, 'compress': 'gzip'})
+        payloads = list(action.get_compressed_payloads(head, tail, resources))
+        found = []
+        for payload in payloads:
+            self.assertTrue(len(payload) <= 4000)
+            found.extend(self.decode_payload(payload)['resources'])
+        self.assertEqual(found, resources)
+        # compression lets each invoke carry more resources
+        self.assertTrue(
+            len(payloads) < len(list(action.get_batches(len(head + tail), resources))))
+
+        action.data['batch_size'] = 100
+        self.assertEqual(
+            len(list(action.get_compressed_payloads(head, tail, resources))), 5)
+
+    def test_compressed_batches_small_payload_raw(self):
+        action = LambdaInvoke({'function': 'xyz', 'compress': 'gzip'})
+        payloads = list(action.get_compressed_payloads(
+            b'{"resources":[', b']}', [{'InstanceId': 'i-1'}, {'InstanceId': 'i-2'}]))
+        self.assertEqual(
+            utils.loads(payloads[0]),
+            {'resources': [{'InstanceId': 'i-1'}, {'InstanceId': 'i-2'}]})
+
+    def test_envelope_with_either_serializer(self):
+        client = mock.MagicMock()
+        client.invoke.side_effect = lambda **params: {'Payload': io.BytesIO(b'')}
+        self.patch(LambdaInvoke, 'get_client', lambda self: client)
+        resources = [{'InstanceId': 'i-%d' % i} for i in range(5)]
+
+        for serializer in (invoke.orjson, None):
+            self.patch(invoke, 'orjson', serializer)
+            client.invoke.reset_mock()
+            action = LambdaInvoke(
+                {'function': 'xyz', 'batch_size': 2},
+                mock.MagicMock(data={'name': 'p', 'resource': 'ec2'}))
+            action.process(resources, event={'detail': {}})
+            found = []
+            for c in client.invoke.call_args_list:
+                payload = utils.loads(c[1]['Payload'])
+                self.assertEqual(payload['policy'], {'name': 'p', 'resource': 'ec2'})
+                self.assertEqual(payload['event'], {'detail': {}})
+                self.assertEqual(payload['action']['function'], 'xyz')
+                found.extend(payload['resources'])
+            self.assertEqual(found, resources)
+
+    def test_invoke_result_payload_string(self):
+        client = mock.MagicMock()
+        client.invoke.side_effect = lambda **params: {
+            'Payload': io.BytesIO(b'' if 'InvocationType' in params else b'{"ok": true}')}
+        action = LambdaInvoke({'function': 'xyz', 'async': False}, mock.MagicMock())
+        self.assertEqual(
+            action.invoke(client, {'FunctionName': 'xyz'}),
+            {'Payload': '{"ok": true}'})
+        self.assertEqual(
+            action.invoke(client, {'FunctionName': 'xyz', 'InvocationType': 'Event'}),
+            {'Payload': ''})
+
+    def test_invoke_batches_concurrent(self):
+        client = mock.MagicMock()
+        client.invoke.side_effect = lambda **params: {'Payload': io.BytesIO(b'')}
+        self.patch(LambdaInvoke, 'get_client', lambda self: client)
+        executors = self.record_executor(LambdaInvoke)
+        action = LambdaInvoke(
+            {'function': 'xyz', 'batch_size': 5, 'concurrency': 4},
+            mock.MagicMock(data={'name': 'p'}))
+        resources = [{'InstanceId': 'i-%d' % i} for i in range(32)]
+        action.process(resources)
+        # one invoke per batch of five, in order, on a pool of the
+        # configured width
+        self.assertEqual([e.max_workers for e in executors], [4])
+        batches = [utils.loads(params['Payload'])['resources']
+                   for params in executors[0].work]
+        self.assertEqual(batches, [resources[i:i + 5] for i in range(0, 32, 5)])
+        self.assertTrue(
+            all(params['InvocationType'] == 'Event' for params in executors[0].work))
+        self.assertEqual(client.invoke.call_count, 7)
+
+    def test_client_cache_per_session(self):
+        class Session(object):
+            def client(self, service, config=None):
+                return mock.MagicMock()
+
+        sessions = [Session()]
+        self.patch(utils, 'local_session', lambda factory: sessions[0])
+        self.patch(LambdaInvoke, '_client_cache', weakref.WeakKeyDictionary())
+        action = LambdaInvoke({'function': 'xyz'}, mock.MagicMock())
+        client = action.get_client()
+        self.assertIs(action.get_client(), client)
+
+        action.data['timeout'] = 30
+        self.assertIsNot(action.get_client(), client)
+
+        # a rotated session gets new clients, the old one is released
+        sessions[0] = Session()
+        action.data['timeout'] = 90
+        self.assertIsNot(action.get_client(), client)
+        gc.collect()
+        self.assertEqual(len(LambdaInvoke._client_cache), 1)
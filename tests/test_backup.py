@@ -13,11 +13,60 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from c7n.resources import backup
+
 from .common import BaseTest
 
 
 class BackupTest(BaseTest):
 
+    def backup_client(self):
+        class ResourceNotFoundException(Exception):
+            pass
+
+        client = self.mock_client(backup)
+        client.exceptions.ResourceNotFoundException = ResourceNotFoundException
+        p = self.load_policy({"name": "all-backup", "resource": "aws.backup-plan"})
+        return p.resource_manager, client
+
+    def test_get_resources_concurrent(self):
+        manager, client = self.backup_client()
+
+        def get_plan(BackupPlanId):
+            if BackupPlanId == "plan-5":
+                raise client.exceptions.ResourceNotFoundException()
+            return {"BackupPlan": {"BackupPlanId": BackupPlanId}}
+
+        client.get_backup_plan.side_effect = get_plan
+        executors = self.record_executor(backup.BackupPlan)
+        ids = ["plan-%d" % i for i in range(20)]
+        self.assertEqual(
+            [r["BackupPlanId"] for r in manager.get_resources(ids)],
+            [i for i in ids if i != "plan-5"])
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(executors[0].work, ids)
+
+    def test_augment_concurrent(self):
+        manager, client = self.backup_client()
+
+        def list_tags(ResourceArn):
+            if ResourceArn == "arn:plan-3":
+                raise client.exceptions.ResourceNotFoundException()
+            return {"Tags": {"Owner": ResourceArn}}
+
+        client.list_tags.side_effect = list_tags
+        self.patch(manager.source, "augment", lambda resources: resources)
+        executors = self.record_executor(backup.BackupPlan)
+        plans = [{"BackupPlanArn": "arn:plan-%d" % i} for i in range(20)]
+        # plans deleted since they were listed are dropped
+        self.assertEqual(
+            manager.augment(plans),
+            [{"BackupPlanArn": "arn:plan-%d" % i,
+              "Tags": [{"Name": "Owner", "Value": "arn:plan-%d" % i}]}
+             for i in range(20) if i != 3])
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(len(executors[0].work), 20)
+
     def test_augment(self):
         factory = self.replay_flight_data("test_backup_augment")
         p = self.load_policy({
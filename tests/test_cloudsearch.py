@@ -13,6 +13,7 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from c7n.resources import cloudsearch
 
 from .common import BaseTest
 
@@ -51,3 +52,18 @@ class CloudSearch(BaseTest):
             0
         ]
         self.assertEqual(state["Deleted"], True)
+
+    def test_delete_search_concurrent(self):
+        client = self.mock_client(cloudsearch)
+        executors = self.record_executor(cloudsearch.Delete)
+        p = self.load_policy(
+            {"name": "csdelete", "resource": "cloudsearch", "actions": ["delete"]})
+        domains = [{"DomainName": "d-%d" % i, "Created": i % 5 != 1, "Deleted": i % 5 == 2}
+                   for i in range(20)]
+        p.resource_manager.actions[0].process(domains)
+        # domains still being created or already deleted are skipped
+        expected = ["d-%d" % i for i in range(20) if i % 5 not in (1, 2)]
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(executors[0].work, expected)
+        self.assertEqual(
+            [c[1]["DomainName"] for c in client.delete_domain.call_args_list], expected)
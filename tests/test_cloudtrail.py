@@ -15,6 +15,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import time
 
+from c7n.resources import cloudtrail
+
 from .common import BaseTest, TestConfig as Config
 
 
@@ -90,6 +92,86 @@ class CloudTrail(BaseTest):
             resources[0]['TrailARN'],
             'arn:aws:cloudtrail:us-east-1:644160558196:trail/orgTrail')
 
+    def trail_client(self, policy):
+        client = self.mock_client(cloudtrail)
+        p = self.load_policy(
+            policy, config={'account_id': '111000111222', 'region': 'us-east-1'})
+        return p.resource_manager, client
+
+    def test_trail_status_concurrent(self):
+        manager, client = self.trail_client({
+            'name': 'resource',
+            'resource': 'cloudtrail',
+            'filters': [{'type': 'status', 'key': 'IsLogging', 'value': True}]})
+        client.get_trail_status.side_effect = lambda Name: {
+            'IsLogging': Name != 'trail-5', 'ResponseMetadata': {}}
+        executors = self.record_executor(cloudtrail.Status)
+        trails = [
+            {'Name': 'trail-%d' % i, 'HomeRegion': 'us-east-1',
+             'TrailARN': 'arn:aws:cloudtrail:us-east-1:111000111222:trail/trail-%d' % i}
+            for i in range(20)]
+        # already annotated trails aren't looked up again
+        trails[0]['c7n:TrailStatus'] = {'IsLogging': True}
+        self.assertEqual(
+            [t['Name'] for t in manager.filters[0].process(trails)],
+            ['trail-%d' % i for i in range(20) if i != 5])
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(
+            [r['Name'] for _, r in executors[0].work],
+            ['trail-%d' % i for i in range(1, 20)])
+        self.assertEqual(trails[5]['c7n:TrailStatus'], {'IsLogging': False})
+
+    def test_set_logging_concurrent(self):
+        manager, client = self.trail_client({
+            'name': 'resource',
+            'resource': 'cloudtrail',
+            'actions': [{'type': 'set-logging', 'enabled': False}]})
+        trails = [
+            {'Name': 'trail-%d' % i, 'HomeRegion': 'us-east-1',
+             'TrailARN': 'arn:aws:cloudtrail:us-east-1:111000111222:trail/trail-%d' % i}
+            for i in range(20)]
+        # shadow copies of a multi region trail are left alone
+        trails.append(
+            {'Name': 'multi', 'IsMultiRegionTrail': True, 'HomeRegion': 'us-west-2',
+             'TrailARN': 'arn:aws:cloudtrail:us-west-2:111000111222:trail/multi'})
+        executors = self.record_executor(cloudtrail.SetLogging)
+        manager.actions[0].process(trails)
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(executors[0].work, trails[:20])
+        self.assertEqual(
+            [c[1]['Name'] for c in client.stop_logging.call_args_list],
+            ['trail-%d' % i for i in range(20)])
+        client.start_logging.assert_not_called()
+
+    def test_is_shadow_state(self):
+        trails = [
+            {'Name': 'local', 'HomeRegion': 'us-east-1',
+             'TrailARN': 'arn:aws:cloudtrail:us-east-1:111000111222:trail/local'},
+            {'Name': 'org', 'IsOrganizationTrail': True, 'HomeRegion': 'us-east-1',
+             'TrailARN': 'arn:aws:cloudtrail:us-east-1:644160558196:trail/org'},
+            {'Name': 'multi', 'IsMultiRegionTrail': True, 'HomeRegion': 'us-west-2',
+             'TrailARN': 'arn:aws:cloudtrail:us-west-2:111000111222:trail/multi'}]
+
+        def shadow_filter(data):
+            p = self.load_policy({
+                'name': 'resource',
+                'resource': 'cloudtrail',
+                'filters': [data]},
+                config={'account_id': '111000111222', 'region': 'us-east-1'})
+            return p.resource_manager.filters[0]
+
+        self.assertEqual(
+            [t['Name'] for t in shadow_filter('is-shadow').process(trails)],
+            ['org', 'multi'])
+        self.assertEqual(
+            [t['Name'] for t in shadow_filter(
+                {'type': 'is-shadow', 'state': True}).process(trails)],
+            ['org', 'multi'])
+        self.assertEqual(
+            [t['Name'] for t in shadow_filter(
+                {'type': 'is-shadow', 'state': False}).process(trails)],
+            ['local'])
+
     def test_cloudtrail_resource_with_not_filter(self):
         factory = self.replay_flight_data("test_cloudtrail_resource_with_not_filter")
         p = self.load_policy(
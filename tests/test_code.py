@@ -13,11 +13,38 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import logging
+
+from botocore.exceptions import ClientError
+
+from c7n.resources import code
+
 from .common import BaseTest
 
 
 class CodeCommit(BaseTest):
 
+    def test_delete_repos_concurrent(self):
+        def delete(repositoryName):
+            if repositoryName == "repo-3":
+                raise ClientError(
+                    {"Error": {"Code": "EncryptionKeyAccessDeniedException"}},
+                    "DeleteRepository")
+
+        client = self.mock_client(code)
+        client.delete_repository.side_effect = delete
+        executors = self.record_executor(code.DeleteRepository)
+        p = self.load_policy(
+            {"name": "delete-repos", "resource": "codecommit", "actions": ["delete"]})
+        repos = [{"repositoryName": "repo-%d" % i} for i in range(20)]
+        output = self.capture_logging("custodian.actions", level=logging.ERROR)
+        p.resource_manager.actions[0].process(repos)
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(executors[0].work, repos)
+        self.assertEqual(client.delete_repository.call_count, 20)
+        # api errors are logged per repository
+        self.assertIn("Exception deleting repo", output.getvalue())
+
     def test_query_repos(self):
         factory = self.replay_flight_data("test_codecommit")
         p = self.load_policy(
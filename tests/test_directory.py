@@ -15,6 +15,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import json
 
+from c7n.resources import directory
+
 from .common import BaseTest, load_data
 
 
@@ -65,6 +67,29 @@ class CloudDirectoryTest(BaseTest):
 
 class DirectoryTests(BaseTest):
 
+    def test_directory_augment_concurrent(self):
+        class EntityDoesNotExistException(Exception):
+            pass
+
+        def list_tags(ResourceId):
+            if ResourceId == "d-3":
+                raise EntityDoesNotExistException()
+            return {"Tags": [{"Key": "Id", "Value": ResourceId}]}
+
+        client = self.mock_client(directory)
+        client.exceptions.EntityDoesNotExistException = EntityDoesNotExistException
+        client.list_tags_for_resource.side_effect = list_tags
+        executors = self.record_executor(directory.Directory)
+        p = self.load_policy({"name": "dirs", "resource": "directory"})
+        dirs = [{"DirectoryId": "d-%d" % i} for i in range(20)]
+        # directories deleted since they were described are dropped
+        self.assertEqual(
+            p.resource_manager.augment(dirs),
+            [{"DirectoryId": "d-%d" % i, "Tags": [{"Key": "Id", "Value": "d-%d" % i}]}
+             for i in range(20) if i != 3])
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(len(executors[0].work), 20)
+
     def test_directory_tag(self):
         session_factory = self.replay_flight_data("test_directory_tag")
         client = session_factory().client("ds")
@@ -15,11 +15,14 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from .common import BaseTest, functional, TestConfig as Config
 
+import mock
 import uuid
 import time
 
 from operator import itemgetter
 
+from c7n.resources import efs
+
 
 class ElasticFileSystem(BaseTest):
 
@@ -84,6 +87,28 @@ class ElasticFileSystem(BaseTest):
         resources = sorted(resources, key=itemgetter("MountTargetId"))
         self.assertEqual(resources[0]["MountTargetId"], "fsmt-a47385dd")
 
+    def test_mount_target_security_group_concurrent(self):
+        client = self.mock_client(efs)
+        client.describe_mount_target_security_groups.side_effect = (
+            lambda MountTargetId: {"SecurityGroups": ["sg-%s" % MountTargetId[-1]]})
+        executors = self.record_executor(efs.SecurityGroup)
+        p = self.load_policy(
+            {
+                "name": "test-mount-secgroup",
+                "resource": "efs-mount-target",
+                "filters": [{"type": "security-group", "key": "GroupId", "value": "sg-1"}],
+            })
+        f = p.resource_manager.filters[0]
+        targets = [{"MountTargetId": "fsmt-%02d" % i} for i in range(30)]
+        self.assertEqual(
+            sorted(f.get_related_ids(targets)),
+            ["sg-%d" % i for i in range(10)])
+        # cached groups are not looked up again
+        f.get_related_ids(targets)
+        self.assertEqual([e.max_workers for e in executors], [10])
+        self.assertEqual(executors[0].work, [t["MountTargetId"] for t in targets])
+        self.assertEqual(client.describe_mount_target_security_groups.call_count, 30)
+
     def test_delete(self):
         factory = self.replay_flight_data("test_efs_delete")
         p = self.load_policy(
@@ -102,6 +127,28 @@ class ElasticFileSystem(BaseTest):
         state = client.describe_file_systems().get("FileSystems", [])
         self.assertEqual(state, [])
 
+    def test_delete_concurrent(self):
+        client = self.mock_client(efs)
+        client.get_paginator.return_value.paginate.side_effect = (
+            lambda FileSystemId: mock.Mock(build_full_result=lambda: {"MountTargets": [
+                {"MountTargetId": "%s-mt-%d" % (FileSystemId, i)} for i in range(2)]}))
+        executors = self.record_executor(efs.Delete)
+        p = self.load_policy(
+            {"name": "efs-delete", "resource": "efs", "actions": ["delete"]})
+        filesystems = [{"FileSystemId": "fs-%d" % i, "NumberOfMountTargets": i % 2}
+                       for i in range(30)]
+        p.resource_manager.actions[0].process(filesystems)
+        mounted = ["fs-%d" % i for i in range(1, 30, 2)]
+        targets = ["%s-mt-%d" % (fs_id, j) for fs_id in mounted for j in range(2)]
+        # unmount describes then deletes mount targets, then file systems go
+        self.assertEqual([e.max_workers for e in executors], [10, 10])
+        self.assertEqual(executors[0].work, mounted + targets)
+        self.assertEqual(executors[1].work, filesystems)
+        self.assertEqual(
+            [c[1]["MountTargetId"] for c in client.delete_mount_target.call_args_list],
+            targets)
+        self.assertEqual(client.delete_file_system.call_count, 30)
+
     def test_kms_alias(self):
         factory = self.replay_flight_data("test_efs_kms_key_filter")
         p = self.load_policy(
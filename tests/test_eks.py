@@ -14,11 +14,34 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import time
+
+from c7n.resources import eks
+
 from .common import BaseTest
 
 
 class EKS(BaseTest):
 
+    def test_delete_concurrent(self):
+        class ResourceNotFoundException(Exception):
+            pass
+
+        def delete(name):
+            if name == "c-3":
+                raise ResourceNotFoundException()
+
+        client = self.mock_client(eks)
+        client.exceptions.ResourceNotFoundException = ResourceNotFoundException
+        client.delete_cluster.side_effect = delete
+        executors = self.record_executor(eks.Delete)
+        p = self.load_policy({"name": "eksdelete", "resource": "eks", "actions": ["delete"]})
+        clusters = [{"name": "c-%d" % i} for i in range(20)]
+        # clusters already gone are skipped
+        p.resource_manager.actions[0].process(clusters)
+        self.assertEqual([e.max_workers for e in executors], [3])
+        self.assertEqual(executors[0].work, clusters)
+        self.assertEqual(client.delete_cluster.call_count, 20)
+
     def test_query_with_subnet_sg_filter(self):
         factory = self.replay_flight_data("test_eks_query")
         p = self.load_policy(
@@ -13,12 +13,22 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from c7n.actions import ModifyVpcSecurityGroupsAction
+from c7n.resources import elasticache
 from c7n.resources.elasticache import _cluster_eligible_for_snapshot
 
 from .common import BaseTest, TestConfig as Config
 
 
-class TestElastiCacheCluster(BaseTest):
+class ActionClientTest(BaseTest):
+
+    def action_client(self, policy):
+        client = self.mock_client(elasticache)
+        p = self.load_policy(policy)
+        return p.resource_manager.actions[0], client
+
+
+class TestElastiCacheCluster(ActionClientTest):
 
     def test_eligibility_snapshot(self):
         # so black box testing, due to use of private interface.
@@ -133,6 +143,27 @@ class TestElastiCacheCluster(BaseTest):
             snap_tags, {"App": "MegaCache", "Color": "Blue", "Env": "Dev", "Zone": "12"}
         )
 
+    def test_elasticache_copy_cluster_tags_concurrent(self):
+        self.patch(
+            elasticache.ElastiCacheCluster, "resources",
+            lambda self: [
+                {"CacheClusterId": "c-%d" % i, "Tags": [{"Key": "App", "Value": "a-%d" % i}]}
+                for i in range(40)])
+        executors = self.record_executor(elasticache.CopyClusterTags)
+        action, client = self.action_client({
+            "name": "elasticache-copy-tags",
+            "resource": "cache-snapshot",
+            "actions": [{"type": "copy-cluster-tags", "tags": ["App"]}]})
+        snapshots = [{"SnapshotName": "snap-%d" % i, "CacheClusterId": "c-%d" % i}
+                     for i in range(40)]
+        action.process(snapshots)
+        self.assertEqual(
+            [e.max_workers for e in executors], [elasticache.ACTION_WORKERS])
+        self.assertEqual(
+            [(arn.rsplit(":", 1)[-1], tags) for arn, tags in executors[0].work],
+            [("snap-%d" % i, [{"Key": "App", "Value": "a-%d" % i}]) for i in range(40)])
+        self.assertEqual(client.add_tags_to_resource.call_count, 40)
+
     def test_elasticache_snapshot_copy_cluster_tags(self):
         session_factory = self.replay_flight_data("test_elasticache_copy_cluster_tags")
         client = session_factory().client("elasticache")
@@ -228,6 +259,76 @@ class TestElastiCacheCluster(BaseTest):
         resources = p.run()
         self.assertEqual(len(resources), 3)
 
+    def test_elasticache_cluster_delete_concurrent(self):
+        executors = self.record_executor(elasticache.DeleteElastiCacheCluster)
+        action, client = self.action_client({
+            "name": "elasticache-delete",
+            "resource": "cache-cluster",
+            "actions": [{"type": "delete", "skip-snapshot": True}]})
+        clusters = [{"CacheClusterId": "c-%d" % i, "Engine": "redis",
+                     "CacheNodeType": "cache.t2.micro"} for i in range(30)]
+        clusters.extend(
+            {"CacheClusterId": "rg-%d-00%d" % (i % 3, i), "ReplicationGroupId": "rg-%d" % (i % 3),
+             "Engine": "redis", "CacheNodeType": "cache.t2.micro"} for i in range(9))
+        action.process(clusters)
+        # clusters and replication groups share one executor
+        self.assertEqual(
+            [e.max_workers for e in executors], [elasticache.ACTION_WORKERS])
+        work = [params for _, params in executors[0].work]
+        self.assertEqual(
+            work[:30], [{"CacheClusterId": "c-%d" % i} for i in range(30)])
+        self.assertEqual(
+            sorted(params["ReplicationGroupId"] for params in work[30:]),
+            ["rg-0", "rg-1", "rg-2"])
+        self.assertEqual(client.delete_cache_cluster.call_count, 30)
+        self.assertEqual(client.delete_replication_group.call_count, 3)
+
+    def test_elasticache_cluster_snapshot_concurrent(self):
+        executors = self.record_executor(elasticache.SnapshotElastiCacheCluster)
+        action, client = self.action_client({
+            "name": "elasticache-snapshot",
+            "resource": "cache-cluster",
+            "actions": ["snapshot"]})
+
+        def snapshot(SnapshotName, CacheClusterId):
+            if CacheClusterId == "c-3":
+                raise ValueError(CacheClusterId)
+
+        client.create_snapshot.side_effect = snapshot
+        output = self.capture_logging("custodian.actions")
+        clusters = [
+            {"CacheClusterId": "c-%d" % i, "Engine": "redis",
+             "CacheNodeType": "cache.t2.micro"} for i in range(40)]
+        action.process(clusters)
+        self.assertEqual(
+            [e.max_workers for e in executors], [elasticache.ACTION_WORKERS])
+        self.assertEqual([c for _, c in executors[0].work], clusters)
+        self.assertEqual(client.create_snapshot.call_count, 40)
+        # snapshot failures are logged rather than raised
+        self.assertIn("Exception creating cache cluster snapshot", output.getvalue())
+
+    def test_elasticache_modify_security_groups_concurrent(self):
+        executors = self.record_executor(
+            elasticache.ElasticacheClusterModifyVpcSecurityGroups)
+        action, client = self.action_client({
+            "name": "elasticache-modify-sg",
+            "resource": "cache-cluster",
+            "actions": [{"type": "modify-security-groups", "add": "sg-new"}]})
+        self.patch(
+            ModifyVpcSecurityGroupsAction, "get_groups",
+            lambda self, resources: [
+                ["sg-%s" % r["ReplicationGroupId"]] for r in resources])
+        clusters = [{"CacheClusterId": "c-%d" % i, "ReplicationGroupId": "rg-%d" % (i % 20)}
+                    for i in range(40)]
+        action.process(clusters)
+        # one update per replication group
+        self.assertEqual(
+            [e.max_workers for e in executors], [elasticache.ACTION_WORKERS])
+        self.assertEqual(
+            sorted(executors[0].work),
+            sorted(("rg-%d" % i, ["sg-rg-%d" % i]) for i in range(20)))
+        self.assertEqual(client.modify_replication_group.call_count, 20)
+
     def test_elasticache_cluster_snapshot(self):
         session_factory = self.replay_flight_data("test_elasticache_cluster_snapshot")
         p = self.load_policy(
@@ -254,7 +355,7 @@ class TestElastiCacheSubnetGroup(BaseTest):
         self.assertEqual(len(resources), 1)
 
 
-class TestElastiCacheSnapshot(BaseTest):
+class TestElastiCacheSnapshot(ActionClientTest):
 
     def test_elasticache_snapshot(self):
         session_factory = self.replay_flight_data("test_elasticache_snapshot")
@@ -329,6 +430,35 @@ class TestElastiCacheSnapshot(BaseTest):
         tags = client.list_tags_for_resource(ResourceName=arn)
         self.assertFalse("maid_status" in tags)
 
+    def test_elasticache_snapshot_delete_concurrent(self):
+        executors = self.record_executor(elasticache.DeleteElastiCacheSnapshot)
+        action, client = self.action_client({
+            "name": "elasticache-snapshot-delete",
+            "resource": "cache-snapshot",
+            "actions": ["delete"]})
+
+        def delete(SnapshotName):
+            if SnapshotName == "snap-120":
+                raise ValueError(SnapshotName)
+
+        client.delete_snapshot.side_effect = delete
+        output = self.capture_logging("custodian.actions")
+        snapshots = [{"SnapshotName": "snap-%d" % i} for i in range(240)]
+        action.process(snapshots)
+        # sets of 50 are taken newest first
+        self.assertEqual(
+            [e.max_workers for e in executors], [elasticache.ACTION_WORKERS])
+        self.assertEqual(
+            [snapshot_set for _, snapshot_set in executors[0].work],
+            [snapshots[::-1][i:i + 50] for i in range(0, 240, 50)])
+        # the failed set stops at its failing snapshot while the other
+        # sets finish
+        deleted = [c[1]["SnapshotName"] for c in client.delete_snapshot.call_args_list]
+        self.assertEqual(
+            sorted(deleted),
+            sorted("snap-%d" % i for i in range(240) if not 90 <= i < 120))
+        self.assertIn("Exception deleting snapshot set", output.getvalue())
+
     def test_elasticache_snapshot_delete(self):
         factory = self.replay_flight_data("test_elasticache_snapshot_delete")
         p = self.load_policy(
@@ -13,6 +13,8 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from c7n.resources import elasticsearch
+
 from .common import BaseTest, TestConfig as Config
 
 
@@ -88,6 +90,55 @@ class ElasticSearch(BaseTest):
         ]
         self.assertEqual(state["Deleted"], True)
 
+    def es_client(self):
+        client = self.mock_client(elasticsearch)
+        client.describe_elasticsearch_domains.side_effect = lambda DomainNames: {
+            "DomainStatusList": [
+                {"DomainName": n, "ARN": "arn:es:%s" % n} for n in DomainNames]}
+        client.list_tags.side_effect = lambda ARN: {
+            "TagList": [{"Key": "Name", "Value": ARN}]}
+        p = self.load_policy({"name": "es", "resource": "elasticsearch"})
+        return p.resource_manager, client
+
+    def test_augment_describe_concurrent(self):
+        manager, client = self.es_client()
+        executors = self.record_executor(elasticsearch.ElasticSearchDomain)
+        names = ["d-%d" % i for i in range(23)]
+        self.assertEqual(
+            [r["DomainName"] for r in manager.augment(names)], names)
+        # describe calls are made in chunks of five names across the pool
+        self.assertEqual(
+            [e.max_workers for e in executors], [manager.augment_workers])
+        self.assertEqual(
+            executors[0].work[:5], [names[i:i + 5] for i in range(0, 23, 5)])
+        self.assertEqual(client.describe_elasticsearch_domains.call_count, 5)
+
+    def test_augment_tags_concurrent(self):
+        manager, client = self.es_client()
+        executors = self.record_executor(elasticsearch.ElasticSearchDomain)
+        names = ["d-%d" % i for i in range(23)]
+        resources = manager.augment(names)
+        self.assertEqual(
+            [r["Tags"] for r in resources],
+            [[{"Key": "Name", "Value": "arn:es:%s" % n}] for n in names])
+        # tag lookups are fanned out per domain after the describe chunks
+        self.assertEqual(len(executors), 1)
+        self.assertEqual(executors[0].work[5:], resources)
+        self.assertEqual(client.list_tags.call_count, 23)
+
+    def test_delete_search_concurrent(self):
+        client = self.mock_client(elasticsearch)
+        executors = self.record_executor(elasticsearch.Delete)
+        p = self.load_policy(
+            {"name": "es-delete", "resource": "elasticsearch", "actions": ["delete"]})
+        domains = [{"DomainName": "d-%d" % i} for i in range(20)]
+        # duplicates are deleted once
+        p.resource_manager.actions[0].process(domains + domains[:5])
+        self.assertEqual(
+            [e.max_workers for e in executors], [elasticsearch.Delete.concurrency])
+        self.assertEqual(executors[0].work, domains)
+        self.assertEqual(client.delete_elasticsearch_domain.call_count, 20)
+
     def test_domain_add_tag(self):
         session_factory = self.replay_flight_data("test_elasticsearch_add_tag")
         client = session_factory(region="us-east-1").client("es")
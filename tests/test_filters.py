@@ -16,10 +16,12 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import calendar
 from datetime import datetime, timedelta
 from dateutil import tz
+import jmespath
 import unittest
 
 from c7n.exceptions import PolicyValidationError
 from c7n import filters as base_filters
+from c7n.filters.related import compile_ids_expression
 from c7n.resources.ec2 import filters
 from c7n.utils import annotation
 from .common import instance, event_data, Bag
@@ -728,5 +730,22 @@ class TestFilterRegistry(unittest.TestCase):
         self.assertRaises(PolicyValidationError, reg.factory, {"type": ""})
 
 
+class TestRelatedIdsExpression(unittest.TestCase):
+
+    def test_compiled_matches_jmespath(self):
+        resources = [
+            {"VpcConfig": {"SubnetIds": ["a", None, "b"], "VpcId": "v1"}},
+            {"VpcConfig": {"SubnetIds": "c"}},
+            {"VpcConfig": "bad"},
+            {"VpcConfig": {"SubnetIds": None}},
+            {},
+        ]
+        for expr in ("VpcConfig.SubnetIds", "VpcConfig.SubnetIds[]",
+                     "VpcConfig.VpcId", "Missing", "VpcConfig.SubnetIds[0]"):
+            self.assertEqual(
+                compile_ids_expression(expr)(resources),
+                jmespath.search("[].%s" % expr, resources))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -73,6 +73,16 @@ class HandleTest(BaseTest):
              'cache_period': 0,
              'log_group': None})
 
+    def test_init_config_account_from_context(self):
+        self.patch(handler, 'account_id', None)
+        context = mock.MagicMock(
+            invoked_function_arn='arn:aws:lambda:us-east-1:644160558196:function:xyz')
+        config = handler.init_config(
+            {'execution-options': {'output_dir': 's3://xyz'},
+             'policies': [{'resource': 'ec2', 'name': 'xyz'}]},
+            context)
+        self.assertEqual(config['account_id'], '644160558196')
+
     def test_dispatch_log_event(self):
         self.patch(handler, 'policy_config', {'policies': []})
         output = self.capture_logging('custodian.lambda', level=logging.INFO)
@@ -117,6 +127,34 @@ class HandleTest(BaseTest):
         handler.dispatch_event({'detail': {'xyz': 'oui'}}, None)
         self.assertEqual(output.getvalue().count('error during'), 2)
 
+    @mock.patch('c7n.handler.PolicyCollection')
+    def test_dispatch_policies_in_order(self, mock_collection):
+        self.patch(handler, 'policy_config', {
+            'execution-options': {'output_dir': 's3://xyz', 'account_id': '004'},
+            'policies': [{'resource': 'ec2', 'name': 'xyz'},
+                         {'resource': 'ec2', 'name': 'abc'}]})
+        self.capture_logging('custodian.lambda', level=logging.WARNING)
+        calls = []
+        first, second = mock.MagicMock(), mock.MagicMock()
+        first.push.side_effect = lambda e, c: calls.append('xyz')
+        second.push.side_effect = lambda e, c: calls.append('abc')
+        mock_collection.from_data.return_value = [first, second]
+
+        handler.dispatch_event({'detail': {}}, None)
+        self.assertEqual(calls, ['xyz', 'abc'])
+
+        # without catch err the first failure stops the run
+        del calls[:]
+        first.push.side_effect = PolicyExecutionError("foo")
+        self.assertRaises(
+            PolicyExecutionError,
+            handler.dispatch_event, {'detail': {}}, None)
+        self.assertEqual(calls, [])
+
+        self.patch(handler, 'C7N_CATCH_ERR', True)
+        handler.dispatch_event({'detail': {}}, None)
+        self.assertEqual(calls, ['abc'])
+
     def test_handler(self):
         level = logging.root.level
         botocore_level = logging.getLogger("botocore").level
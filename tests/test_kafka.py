@@ -1,5 +1,7 @@
 import time
 
+from c7n.resources import kafka
+
 from .common import BaseTest
 
 
@@ -38,3 +40,25 @@ class KafkaTest(BaseTest):
         client = factory().client('kafka')
         cluster = client.describe_cluster(ClusterArn=resources[0]['ClusterArn']).get('ClusterInfo')
         self.assertEqual(cluster['State'], 'DELETING')
+
+    def test_delete_concurrent(self):
+        class NotFoundException(Exception):
+            pass
+
+        client = self.mock_client(kafka)
+        client.exceptions.NotFoundException = NotFoundException
+
+        def delete(ClusterArn):
+            if ClusterArn == "arn:kafka:7":
+                raise NotFoundException()
+
+        client.delete_cluster.side_effect = delete
+        executors = self.record_executor(kafka.Delete)
+        p = self.load_policy(
+            {"name": "kafka", "resource": "aws.kafka", "actions": ["delete"]})
+        clusters = [{"ClusterArn": "arn:kafka:%d" % i} for i in range(20)]
+        # clusters already gone are skipped, duplicates are deleted once
+        p.resource_manager.actions[0].process(clusters + clusters[:5])
+        self.assertEqual([e.max_workers for e in executors], [kafka.Delete.concurrency])
+        self.assertEqual(executors[0].work, clusters)
+        self.assertEqual(client.delete_cluster.call_count, 20)
@@ -13,11 +13,17 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from c7n.resources import kinesis
+
 from .common import BaseTest, TestConfig as Config
 
 
 class Kinesis(BaseTest):
 
+    def action_client(self, policy):
+        client = self.mock_client(kinesis)
+        return self.load_policy(policy).resource_manager.actions[0], client
+
     def test_stream_query(self):
         factory = self.replay_flight_data("test_kinesis_stream_query")
         p = self.load_policy(
@@ -54,6 +60,19 @@ class Kinesis(BaseTest):
         ]
         self.assertEqual(stream["StreamStatus"], "DELETING")
 
+    def test_stream_delete_concurrent(self):
+        executors = self.record_executor(kinesis.Delete)
+        action, client = self.action_client(
+            {"name": "kstream", "resource": "kinesis", "actions": ["delete"]})
+        streams = [{"StreamName": "s-%d" % i,
+                    "StreamStatus": "ACTIVE" if i % 4 else "UPDATING"}
+                   for i in range(40)]
+        action.process(streams)
+        # only active streams are deleted
+        self.assertEqual([e.max_workers for e in executors], [kinesis.Delete.concurrency])
+        self.assertEqual(executors[0].work, ["s-%d" % i for i in range(40) if i % 4])
+        self.assertEqual(client.delete_stream.call_count, 30)
+
     def test_stream_encrypt(self):
         factory = self.replay_flight_data("test_kinesis_encrypt")
         p = self.load_policy(
@@ -109,6 +128,20 @@ class Kinesis(BaseTest):
             "DELETING",
         )
 
+    def test_firehose_delete_concurrent(self):
+        executors = self.record_executor(kinesis.FirehoseDelete)
+        action, client = self.action_client(
+            {"name": "khose", "resource": "firehose", "actions": ["delete"]})
+        streams = [{"DeliveryStreamName": "d-%d" % i,
+                    "DeliveryStreamStatus": "ACTIVE" if i % 4 else "CREATING"}
+                   for i in range(40)]
+        action.process(streams)
+        # streams still being created are skipped
+        self.assertEqual(
+            [e.max_workers for e in executors], [kinesis.FirehoseDelete.concurrency])
+        self.assertEqual(executors[0].work, ["d-%d" % i for i in range(40) if i % 4])
+        self.assertEqual(client.delete_delivery_stream.call_count, 30)
+
     def test_firehose_extended_s3_encrypt_s3_destination(self):
         factory = self.replay_flight_data("test_firehose_ext_s3_encrypt_s3_destination")
         p = self.load_policy(
@@ -96,3 +96,41 @@ class LockedTests(BaseTest):
         f_locked = p.resource_manager.filters[0]
         result = f_locked.process([{"GroupId": "sg-123", "VpcId": "vpc-123"}])
         self.assertEqual(len(result), 1)
+
+    def test_concurrent_lookups_share_session(self):
+        calls = []
+
+        class Response(object):
+            def __init__(self, group_id):
+                self.group_id = group_id
+
+            def json(self):
+                if self.group_id in ("sg-3", "sg-17"):
+                    return {"LockStatus": "locked", "RevisionDate": time.time()}
+                return {"LockStatus": "unlocked"}
+
+        def get(session, url, params=None, auth=None):
+            calls.append((session, url))
+            return Response(url.rsplit("/", 1)[-1])
+
+        self.patch(Locked, "get_api_credentials", noop)
+        self.patch(requests.Session, "get", get)
+        executors = self.record_executor(Locked)
+        p = self.load_policy(
+            {
+                "name": "ltest",
+                "resource": "security-group",
+                "filters": [{"type": "locked", "endpoint": "http://example.com/bar"}],
+            }
+        )
+        f_locked = p.resource_manager.filters[0]
+        resources = [{"GroupId": "sg-%d" % i, "VpcId": "vpc-123"} for i in range(40)]
+        result = f_locked.process(resources)
+        self.assertEqual([r["GroupId"] for r in result], ["sg-3", "sg-17"])
+        # one lookup per resource, all on the filter's one session
+        self.assertEqual([e.max_workers for e in executors], [Locked.max_workers])
+        self.assertEqual(executors[0].work, resources)
+        self.assertEqual(
+            [url.rsplit("/", 1)[-1] for _, url in calls],
+            [r["GroupId"] for r in resources])
+        self.assertEqual(len(set(id(s) for s, _ in calls)), 1)
@@ -13,6 +13,10 @@
 # limitations under the License.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from botocore.exceptions import ClientError
+
+from c7n.resources import opsworks
+
 from .common import BaseTest
 
 
@@ -100,3 +104,71 @@ class TestOpsWorksStack(BaseTest):
         remainder = client.describe_stacks()["Stacks"]
         self.assertEqual(len(remainder), 1)
         self.assertNotEqual(remainder[0]["Name"], "test-delete-opswork-stack")
+
+    def delete_stack_client(self, instance_status):
+        executors = self.record_executor(opsworks.DeleteStack)
+        client = self.mock_client(opsworks)
+        client.describe_apps.return_value = {"Apps": [{"AppId": "a-1"}]}
+        client.describe_instances.return_value = {"Instances": [
+            {"InstanceId": "i-1", "Status": instance_status}]}
+        client.describe_layers.return_value = {"Layers": [{"LayerId": "l-1"}]}
+        p = self.load_policy(
+            {"name": "delete-stack", "resource": "opswork-stack",
+             "actions": ["delete"]})
+        return p.resource_manager.actions[0], client, executors
+
+    def test_delete_stack_stopped(self):
+        action, client, executors = self.delete_stack_client("stopped")
+        action.process([
+            {"StackId": "s-1", "Name": "one"},
+            {"StackId": "s-1", "Name": "one"}])
+        client.delete_app.assert_called_once_with(AppId="a-1")
+        client.delete_instance.assert_called_once_with(InstanceId="i-1")
+        client.delete_layer.assert_called_once_with(LayerId="l-1")
+        client.delete_stack.assert_called_once_with(StackId="s-1")
+        # describes, stacks, then each stack's app/instance and layer deletes
+        self.assertEqual(
+            [e.max_workers for e in executors],
+            [action.describe_concurrency, action.stack_concurrency,
+             action.concurrency, action.concurrency])
+        self.assertEqual(len(executors[0].work), 3)
+        self.assertEqual(
+            [stack["StackId"] for _, stack, _ in executors[1].work], ["s-1"])
+
+    def test_delete_stack_client_pool(self):
+        self.patch(opsworks.DeleteStack, "stack_concurrency", 4)
+        action, client, executors = self.delete_stack_client("stopped")
+        session = opsworks.local_session(None)
+        action.process([{"StackId": "s-1", "Name": "one"}])
+        config = session.client.call_args[1]["config"]
+        self.assertEqual(config.max_pool_connections, 20)
+
+    def test_delete_stack_running_instances(self):
+        action, client, executors = self.delete_stack_client("online")
+        output = self.capture_logging("custodian.actions")
+        action.process([{"StackId": "s-1", "Name": "one"}])
+        self.assertIn("All instances must be stopped", output.getvalue())
+        # nothing is removed from a stack that can't be deleted
+        client.delete_app.assert_not_called()
+        client.delete_instance.assert_not_called()
+        client.delete_layer.assert_not_called()
+        client.delete_stack.assert_not_called()
+
+    def test_delete_stack_describe_error(self):
+        action, client, executors = self.delete_stack_client("stopped")
+
+        def describe_layers(StackId):
+            if StackId == "s-2":
+                raise ClientError(
+                    {"Error": {"Code": "ResourceNotFoundException"}}, "DescribeLayers")
+            return {"Layers": [{"LayerId": "l-1"}]}
+
+        client.describe_layers.side_effect = describe_layers
+        output = self.capture_logging("custodian.actions")
+        action.process([
+            {"StackId": "s-1", "Name": "one"}, {"StackId": "s-2", "Name": "two"}])
+        # a stack that couldn't be described is logged and left alone
+        self.assertIn("Exception describing stack:s-2", output.getvalue())
+        self.assertEqual(
+            [stack["StackId"] for _, stack, _ in executors[1].work], ["s-1"])
+        client.delete_stack.assert_called_once_with(StackId="s-1")
@@ -14,11 +14,17 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import mock
+import os
 from json import dumps
 from jsonschema.exceptions import best_match
 
+from c7n import schema as schema_mod
+from c7n.filters import ValueFilter
 from c7n.manager import resources
-from c7n.schema import Validator, validate, generate, specific_error, policy_error_scope
+from c7n.registry import PluginRegistry
+from c7n.schema import (
+    Validator, validate, generate, get_validator, get_schema_validator, check_unique,
+    specific_error, policy_error_scope, load_schema_cache, save_schema_cache)
 from .common import BaseTest
 
 
@@ -57,6 +63,88 @@ class SchemaTest(BaseTest):
         except Exception:
             self.fail("Failed to serialize schema")
 
+    def test_validator_cache(self):
+        validator = get_validator()
+        self.assertIs(get_validator(), validator)
+
+        class CacheTest(ValueFilter):
+            pass
+
+        resource_type = resources.get('ec2')
+        resource_type.filter_registry.register('cache-test', CacheTest)
+        self.addCleanup(resource_type.filter_registry.unregister, 'cache-test')
+        self.assertIsNot(get_validator(), validator)
+
+    def test_registry_signature_cached(self):
+        signature = schema_mod._registry_signature()
+        self.assertIs(schema_mod._registry_signature(), signature)
+
+    def test_registry_signature_replaced(self):
+        resource_type = resources.get('ec2')
+        original = resource_type.filter_registry.get('value')
+        signature = schema_mod._registry_signature()
+
+        class ReplacedValue(ValueFilter):
+            pass
+
+        resource_type.filter_registry.register('value', ReplacedValue)
+        self.addCleanup(resource_type.filter_registry.register, 'value', original)
+        self.assertNotEqual(schema_mod._registry_signature(), signature)
+
+    def test_schema_disk_cache_opt_in(self):
+        self.patch(schema_mod, 'SCHEMA_CACHE_DIR', None)
+        self.patch(schema_mod, '_SCHEMA_CACHE', {})
+        with mock.patch.object(schema_mod, 'save_schema_cache') as save:
+            get_validator()
+        self.assertFalse(save.called)
+
+    def test_schema_disk_cache_json(self):
+        cache_dir = self.get_temp_dir()
+        self.patch(schema_mod, 'SCHEMA_CACHE_DIR', cache_dir)
+        path = os.path.join(cache_dir, 'schema-test.json')
+        schema = {'type': 'object', 'properties': {'policies': {'type': 'array'}}}
+        save_schema_cache(path, schema)
+        with open(path) as fh:
+            self.assertTrue(fh.read().startswith('{'))
+        self.assertEqual(load_schema_cache(path), schema)
+
+        with open(path, 'w') as fh:
+            fh.write('not json')
+        self.assertEqual(load_schema_cache(path), None)
+
+    def test_schema_disk_cache_pruned(self):
+        cache_dir = self.get_temp_dir()
+        self.patch(schema_mod, 'SCHEMA_CACHE_DIR', cache_dir)
+        self.patch(schema_mod, 'SCHEMA_CACHE_SIZE', 2)
+        for i in range(4):
+            path = os.path.join(cache_dir, 'schema-%d.json' % i)
+            save_schema_cache(path, {})
+            os.utime(path, (i, i))
+        save_schema_cache(os.path.join(cache_dir, 'schema-4.json'), {})
+        self.assertEqual(
+            sorted(os.listdir(cache_dir)), ['schema-3.json', 'schema-4.json'])
+
+    def test_schema_validator_cache(self):
+        schema = {'type': 'object', 'properties': {'policies': {'type': 'array'}}}
+        validator = get_schema_validator(schema)
+        self.assertIs(get_schema_validator(schema), validator)
+        self.assertIsNot(get_schema_validator(dict(schema)), validator)
+        # registering a plugin invalidates validators
+        self.patch(PluginRegistry, 'generation', PluginRegistry.generation + 1)
+        self.assertIsNot(get_schema_validator(schema), validator)
+
+    def test_generate_schemas_independent(self):
+        schema = generate()
+        schema['definitions']['filters']['valuekv']['maxProperties'] = 5
+        schema['definitions']['max-resources-properties']['properties']['op']['enum'].append('xor')
+        schema['definitions']['resources']['aws.ec2']['policy']['allOf'].pop()
+        fresh = generate()
+        self.assertEqual(fresh['definitions']['filters']['valuekv']['maxProperties'], 1)
+        self.assertNotIn(
+            'xor', fresh['definitions']['max-resources-properties']['properties']['op']['enum'])
+        self.assertEqual(
+            len(fresh['definitions']['resources']['aws.ec2']['policy']['allOf']), 2)
+
     def test_empty_skeleton(self):
         self.assertEqual(validate({"policies": []}), [])
 
@@ -73,6 +161,26 @@ class SchemaTest(BaseTest):
         self.assertTrue(isinstance(result[0], ValueError))
         self.assertTrue("monday-morning" in str(result[0]))
 
+    def test_duplicate_policies_reported(self):
+        data = {
+            "policies": [
+                {"name": "alpha", "resource": "ec2"},
+                {"name": "beta", "resource": "ec2"},
+                {"name": "beta", "resource": "ec2"},
+                {"name": "alpha", "resource": "ec2"},
+                {"name": "gamma", "resource": "ec2"},
+            ]
+        }
+        error, name = check_unique(data)
+        self.assertEqual(name, "alpha")
+        message = str(error)
+        self.assertTrue(message.startswith(
+            "Only one policy with a given name allowed, duplicates: Counter("))
+        self.assertIn("alpha", message)
+        self.assertIn("beta", message)
+        self.assertNotIn("gamma", message)
+        self.assertEqual(check_unique({"policies": data["policies"][:2]}), None)
+
     def test_py3_policy_error(self):
         data = {
             'policies': [{
@@ -16,6 +16,8 @@ from .common import BaseTest
 
 import time
 
+from c7n.filters import securityhub
+
 LambdaFindingId = "us-east-2/644160558196/81cc9d38b8f8ebfd260ecc81585b4bc9/9f5932aa97900b5164502f41ae393d23" # NOQA
 
 
@@ -250,6 +252,41 @@ class SecurityHubTest(BaseTest):
         resources = policy.run()
         self.assertEqual(len(resources), 1)
 
+    def test_findings_filter_batches(self):
+        def get_findings(Filters, MaxResults, NextToken=None):
+            arns = [f["Value"] for f in Filters["ResourceId"]]
+            # two pages per batch, findings only for even numbered instances
+            page = arns[:10] if NextToken is None else arns[10:]
+            return {
+                "Findings": [{"Id": "f-" + arn, "Resources": [{"Id": arn}]}
+                             for arn in page if int(arn.rsplit("-", 1)[-1]) % 2 == 0],
+                "NextToken": "next" if NextToken is None and len(arns) > 10 else None}
+
+        client = self.mock_client(securityhub)
+        client.get_findings.side_effect = get_findings
+        executors = self.record_executor(securityhub.SecurityHubFindingFilter)
+        policy = self.load_policy(
+            {"name": "ec2-findings", "resource": "ec2", "filters": [{"type": "finding"}]},
+            config={"account_id": "101010101111"})
+        self.patch(
+            policy.resource_manager, "get_arns",
+            lambda resources: ["arn:ec2:%s" % r["InstanceId"] for r in resources])
+        instances = [{"InstanceId": "i-%d" % i} for i in range(55)]
+        f = policy.resource_manager.filters[0]
+        matched = f.process(instances)
+
+        arns = ["arn:ec2:i-%d" % i for i in range(55)]
+        self.assertEqual([e.max_workers for e in executors], [f.max_workers])
+        self.assertEqual(executors[0].work, [arns[:20], arns[20:40], arns[40:]])
+        # a second page is fetched for each batch larger than a page
+        self.assertEqual(client.get_findings.call_count, 6)
+        self.assertEqual(
+            [r["InstanceId"] for r in matched],
+            ["i-%d" % i for i in range(0, 55, 2)])
+        self.assertEqual(
+            matched[1]["c7n:finding-filter"],
+            [{"Id": "f-arn:ec2:i-2", "Resources": [{"Id": "arn:ec2:i-2"}]}])
+
     def test_alb_findings_filter(self):
         factory = self.replay_flight_data("test_security_hub_alb_findings_filter")
         policy = self.load_policy(
@@ -190,6 +190,18 @@ class UtilTest(BaseTest):
             sorter(list(utils.group_by(items, "Type.Part").keys())), [None, "a", "b"]
         )
 
+    def test_client_config(self):
+        config = utils.client_config(pool=16)
+        self.assertIs(utils.client_config(pool=16), config)
+        self.assertEqual(config.max_pool_connections, 16)
+        self.assertEqual(config.retries['mode'], 'adaptive')
+        self.assertEqual(utils.client_config().max_pool_connections, 10)
+
+    def test_unique_by(self):
+        items = [{"Id": "a", "v": 1}, {"Id": "b"}, {"Id": "a", "v": 2}]
+        self.assertEqual(
+            utils.unique_by(items, "Id"), [{"Id": "a", "v": 1}, {"Id": "b"}])
+
     def write_temp_file(self, contents, suffix=".tmp"):
         """ Write a temporary file and return the filename.
 